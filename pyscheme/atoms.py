@@ -1,16 +1,26 @@
 # from pyscheme.typing import Expression
+import weakref
 
 
 class Symbol(str):
     pass
 
 
+# Interning cache: the same token appears thousands of times in a parsed
+# bundle; sharing one Symbol per spelling cuts allocations and lets equal
+# symbols compare by pointer first. Weak values so unused symbols can go away.
+_SYMBOL_CACHE: 'weakref.WeakValueDictionary[str, Symbol]' = weakref.WeakValueDictionary()
+
+
 def atom(token) -> 'Expression':
-    """Numbers become numbers; every other token is a symbol."""
+    """Numbers become numbers; every other token is an (interned) symbol."""
     try:
         return int(token)
     except ValueError:
         try:
             return float(token)
         except ValueError:
-            return Symbol(token)
+            s = _SYMBOL_CACHE.get(token)
+            if s is None:
+                s = _SYMBOL_CACHE[token] = Symbol(token)
+            return s
@@ -0,0 +1,123 @@
+"""
+Compilation of expressions to Python closures.
+
+compile_expression walks the AST once and returns a callable f(env), so that
+repeated evaluation of the same expression pays only the closure calls,
+without re-dispatching on every node as core.evaluate does.
+"""
+import functools
+import math
+import operator as op
+import typing
+
+from pyscheme import atoms
+from pyscheme import core
+from pyscheme.typing import Expression
+
+# Operators safe to evaluate at fold time: pure, and their meaning is fixed
+# by make_root_environment rather than by user definitions in practice.
+_PURE_OPS = {
+    '+': lambda *xs: sum(xs),  # n-ary, as produced by the flattened parser
+    '-': op.sub,
+    '*': lambda *xs: functools.reduce(op.mul, xs, 1),
+    '/': op.truediv,
+    '^': op.pow,
+    'expt': op.pow,
+    'mod': op.mod,
+    'abs': abs,
+    'round': round,
+    'min': min,
+    'max': max,
+}
+
+
+def fold(expr: Expression) -> Expression:
+    """
+    One-time constant folding: recursively replace subtrees whose operator is
+    pure and whose arguments are all literals with their evaluated result, so
+    that e.g. (+ aPar (* 2 3)) is stored as (+ aPar 6).
+    Symbol leaves are treated as non-constant; special forms are left alone.
+    """
+    if not isinstance(expr, list) or not expr:
+        return expr
+    head = expr[0]
+    if not isinstance(head, atoms.Symbol) or head in core._SPECIAL_FORMS:
+        # Only plain procedure calls with a symbol head are candidates
+        return expr
+    args = [fold(arg) for arg in expr[1:]]
+    if head in _PURE_OPS and not any(isinstance(arg, (atoms.Symbol, list)) for arg in args):
+        try:
+            return _PURE_OPS[head](*args)
+        except Exception:
+            pass  # e.g. division by zero: leave it to fail at evaluation time
+    return [head] + args
+
+
+# Operators emitted as Python infix source in the codegen fast path.
+# Codegen assumes these keep the arithmetic meaning bound by
+# make_root_environment; rebinding e.g. '+' is not supported there.
+_INFIX_OPS = {'+': '+', '-': '-', '*': '*', '/': '/', '^': '**', 'expt': '**', 'mod': '%'}
+
+
+class _CannotEmit(Exception):
+    pass
+
+
+def _emit(expr: Expression) -> str:
+    """Emit Python source for a purely arithmetic tree, or raise _CannotEmit."""
+    if isinstance(expr, atoms.Symbol):
+        return f'env[{str(expr)!r}]'
+    if isinstance(expr, (int, float)):
+        if isinstance(expr, float) and not math.isfinite(expr):
+            # repr(float('nan')) is the bare name 'nan', which is unbound in
+            # the emitted source; leave non-finite literals to the closures.
+            raise _CannotEmit
+        return repr(expr)
+    if (isinstance(expr, list) and len(expr) >= 3
+            and isinstance(expr[0], atoms.Symbol) and expr[0] in _INFIX_OPS
+            and (len(expr) == 3 or expr[0] in ('+', '*'))):  # only +/* are n-ary
+        infix = f' {_INFIX_OPS[expr[0]]} '
+        return '(' + infix.join(_emit(arg) for arg in expr[1:]) + ')'
+    raise _CannotEmit
+
+
+def compile_expression(expr: Expression) -> typing.Callable[['core.Environment'], Expression]:
+    """
+    Compile expr to a callable taking an Environment and returning the
+    evaluated expression. Equivalent to functools.partial(core.evaluate, expr)
+    but with the tree walk and special-form dispatch done once, here.
+
+    Purely arithmetic trees are lowered further, to a single Python code
+    object, so numeric-heavy templates evaluate without one closure call per
+    AST node.
+    """
+    try:
+        return eval('lambda env: ' + _emit(expr))
+    except _CannotEmit:
+        pass
+
+    if isinstance(expr, atoms.Symbol):  # variable reference
+        return lambda env, s=expr: env[s]
+    if not isinstance(expr, list):  # constant literal
+        return lambda env, x=expr: x
+
+    head = expr[0]
+    if isinstance(head, atoms.Symbol):
+        if head == 'quote':
+            (_, exp) = expr
+            return lambda env, x=exp: x
+        if head == 'if':
+            (_, test, conseq, alt) = expr
+            ct = compile_expression(test)
+            cc = compile_expression(conseq)
+            ca = compile_expression(alt)
+            return lambda env: cc(env) if ct(env) else ca(env)
+        if head in core._SPECIAL_FORMS:
+            # define / set! / lambda mutate or capture the environment;
+            # defer these to the interpreter.
+            return lambda env, x=expr: core.evaluate(x, env)
+
+    # procedure call
+    ch = compile_expression(head)
+    cargs = [compile_expression(arg) for arg in expr[1:]]
+    return lambda env: ch(env)(*[a(env) for a in cargs])
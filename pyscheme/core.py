@@ -1,7 +1,13 @@
+import threading
 import weakref
-from typing import Optional, Tuple, Set, Iterable, Dict
+from typing import Callable, Optional, Tuple, Set, Iterable, Dict
 
-from pyscheme.typing import *
+from pyscheme import atoms
+from pyscheme.typing import Expression
+
+# Stack of symbols currently being evaluated, used to record which symbols a
+# definition reads so that updates can invalidate only the affected values.
+_reading = threading.local()
 
 
 class Environment:
@@ -27,50 +33,148 @@ class Environment:
     for the actual evaluations, so this should not be a problem.
     """
 
+    # One Environment is allocated per evaluate() call; slots drop the
+    # per-instance __dict__ and make attribute access an offset lookup.
+    __slots__ = ('parent', '_definition_map', '_value_map', '_compiled_map',
+                 '_deps', '_rdeps', '_update_listeners', '_all_names_cache',
+                 '__weakref__')
+
     def __init__(self,
                  parent: Optional['Environment'] = None,
                  values: Iterable[Tuple[str, Expression]] = (),
-                 definitions: Iterable[Tuple[str, Expression]] = ()):
+                 definitions: Iterable[Tuple[str, Expression]] = (),
+                 persistent: bool = True):
         self.parent = parent
         self._definition_map: Dict[str, Expression] = {k: v for k, v in definitions}
         self._value_map: Dict[str, Expression] = {k: v for k, v in values}
-        self._update_listeners = weakref.WeakSet()
+        self._compiled_map: Dict[str, Callable] = {}  # definitions compiled to closures, lazily
+        self._deps: Dict[str, Set[str]] = {}  # symbol -> symbols its evaluation read
+        self._rdeps: Dict[str, Set[str]] = {}  # symbol -> symbols whose evaluation read it
+        # List of (weak reference to listener, symbol filter or None) pairs
+        self._update_listeners = []
+        self._all_names_cache: Optional[frozenset] = None
 
-        if parent is not None:
+        # Short-lived environments can pass persistent=False to skip listener
+        # registration on the parent; throwaway evaluation envs use
+        # _TransientEnv instead and never register at all.
+        if parent is not None and persistent:
             parent.add_update_listener(self._handle_update)
 
-    def add_update_listener(self, listener):
-        self._update_listeners.add(listener)
+    def add_update_listener(self, listener, symbols: Optional[Set[str]] = None):
+        """
+        Register a listener to be called on definition updates.
+        If symbols is given, the listener is only called for updates that
+        affect at least one of those symbols.
+        """
+        # WeakMethod, because a plain weakref to a bound method dies immediately
+        ref = weakref.WeakMethod(listener) if hasattr(listener, '__self__') \
+            else weakref.ref(listener)
+        self._update_listeners.append((ref, symbols))
 
     def _handle_update(self, modified_symbols: Optional[Set[str]] = None):
-        # Future performance improvement would track dependency 
-        # of each evaluated symbol (by evaluating in mock environment)
-        # and carefully update expression map to match/
-        # For now, delete full cache on each update
-        self._value_map.clear()
-        self._notify_listeners(None)
+        self._all_names_cache = None
+        if modified_symbols is None:
+            # Unknown provenance: consider everything unsafe
+            self._value_map.clear()
+            self._notify_listeners(None)
+            return
+        # Invalidate only the modified symbols and their transitive dependents,
+        # as recorded in _rdeps, and forward the precise set to listeners.
+        affected = set(modified_symbols)
+        queue = list(affected)
+        while queue:
+            for dependent in self._rdeps.get(queue.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    queue.append(dependent)
+        for s in affected:
+            self._value_map.pop(s, None)
+        self._notify_listeners(affected)
 
     def _notify_listeners(self, modified_symbols=None):
-        for listener in self._update_listeners:
-            listener(modified_symbols)
+        live = []
+        for ref, symbol_filter in self._update_listeners:
+            listener = ref()
+            if listener is None:
+                continue  # Compact dead references as we go
+            live.append((ref, symbol_filter))
+            if (symbol_filter is None or modified_symbols is None
+                    or symbol_filter & modified_symbols):
+                listener(modified_symbols)
+        self._update_listeners = live
 
     def evaluate(self, expr: Expression):
         """
-        Evaluate expression in a child environment
+        Evaluate expression in a throwaway child environment
+        """
+        return evaluate(expr, _TransientEnv(self))
+
+    def _record_read(self, s: str):
+        """Record that the symbol currently being evaluated (if any) reads s"""
+        stack = getattr(_reading, 'stack', None)
+        if stack:
+            reader = stack[-1]
+            if reader != s:
+                self._deps.setdefault(reader, set()).add(s)
+                self._rdeps.setdefault(s, set()).add(reader)
+        return stack
+
+    def evaluate_vectorized(self, expr: Expression, arrays: Dict[str, 'numpy.ndarray']):
+        """
+        Evaluate expression with the given symbols bound to NumPy arrays,
+        returning an array. Arithmetic broadcasts elementwise, so a whole
+        parameter sweep costs one C-level pass per operation instead of one
+        full evaluation per row.
+        :param arrays: map of symbol name -> numpy array (or anything that
+            broadcasts through arithmetic operators)
         """
-        return evaluate(expr, Environment(parent=self))
+        import numpy as np  # deferred: pyscheme itself does not require numpy
+
+        # math-module functions don't accept arrays; shadow them with ufuncs
+        ufuncs = {'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
+                  'asin': np.arcsin, 'acos': np.arccos, 'atan': np.arctan,
+                  'atan2': np.arctan2, 'sqrt': np.sqrt, 'exp': np.exp,
+                  'log': np.log, 'log10': np.log10}
+        env = _TransientEnv(self, values=ufuncs.items())
+        env._value_map.update(arrays)
+        return evaluate(expr, _TransientEnv(env))
 
     def __getitem__(self, s: str):
+        stack = self._record_read(s)
+
         if s in self._value_map:
             return self._value_map[s]
         if s in self._definition_map:
-            # Compute value from definition in a throwaway child environment
-            value = self.evaluate(self._definition_map[s])
-        elif self.parent:
-            value = self.parent[s]
+            # Compute value from definition in a throwaway child environment,
+            # compiling the definition to a closure on first access
+            compiled = self._compiled_map.get(s)
+            if compiled is None:
+                compiled = _compile.compile_expression(self._definition_map[s])
+                self._compiled_map[s] = compiled
+            if stack is None:
+                stack = _reading.stack = []
+            stack.append(s)
+            try:
+                value = compiled(_TransientEnv(self))
+            finally:
+                stack.pop()
         else:
-            # self is the root environment
-            raise KeyError(f'Symbol "{s}" not defined')
+            # Walk the parent chain with a local loop rather than recursing;
+            # the common case is a plain value hit several ancestors up.
+            env = self.parent
+            while env is not None:
+                if s in env._value_map:
+                    env._record_read(s)
+                    value = env._value_map[s]
+                    break
+                if s in env._definition_map:
+                    # Evaluate (and cache) at the defining level
+                    value = env[s]
+                    break
+                env = env.parent
+            else:
+                # self is the root environment
+                raise KeyError(f'Symbol "{s}" not defined')
 
         # Store symbol value in local cache, even if provided by parent
         self._value_map[s] = value
@@ -85,26 +189,82 @@ class Environment:
         else:
             raise KeyError(f'Symbol "{s}" has not been defined')
 
+    def _all_names(self) -> frozenset:
+        """
+        Flat set of every name visible from this environment, cached lazily.
+        Invalidated on local mutation and on (notified) ancestor updates.
+        """
+        names = self._all_names_cache
+        if names is None:
+            names = frozenset(self._value_map) | frozenset(self._definition_map)
+            if self.parent:
+                names |= self.parent._all_names()
+            self._all_names_cache = names
+        return names
+
     def __contains__(self, s: str):
-        return (
-                s in self._value_map
-                or s in self._definition_map
-                or (self.parent and s in self.parent))
+        # One hash probe against a flat set, instead of up to three dict
+        # probes per level of the parent chain
+        return s in self._all_names()
 
     def add(self, s: str, expr: Expression):
         self._value_map[s] = expr
+        self._all_names_cache = None
+        # Descendants cache both values and visible-name sets; tell them
+        self._notify_listeners({s})
 
     def update(self, values: Iterable[Tuple[str, Expression]]):
         """Add or update values in env"""
+        values = dict(values)
         self._value_map.update(values)
+        self._all_names_cache = None
+        if values:
+            self._notify_listeners(set(values))
 
     def define(self, s: str, expr: Expression):
         """Add or replace definition"""
-        self._definition_map[s] = expr
-        self._handle_update(set(s))
+        self._definition_map[s] = _compile.fold(expr)
+        self._compiled_map.pop(s, None)
+        self._handle_update({s})
         return self
 
 
+class _TransientEnv:
+    """
+    Lightweight throwaway environment for a single evaluation.
+    Skips the listener registration, dependency bookkeeping, and local value
+    caching of Environment: throwaway children never notify anyone, so they
+    only need a local scope dict and a parent to delegate to.
+    """
+
+    __slots__ = ('parent', '_value_map')
+
+    def __init__(self, parent, values: Iterable[Tuple[str, Expression]] = ()):
+        self.parent = parent
+        self._value_map = {k: v for k, v in values}
+
+    def __getitem__(self, s: str):
+        try:
+            return self._value_map[s]
+        except KeyError:
+            return self.parent[s]
+
+    def __setitem__(self, s: str, expr: Expression):
+        if s in self._value_map:
+            self._value_map[s] = expr
+        else:
+            self.parent[s] = expr
+
+    def __contains__(self, s: str):
+        return s in self._value_map or s in self.parent
+
+    def add(self, s: str, expr: Expression):
+        self._value_map[s] = expr
+
+    def evaluate(self, expr: Expression):
+        return evaluate(expr, _TransientEnv(self))
+
+
 def is_symbol(x: Expression, s: str):
     return isinstance(x, atoms.Symbol) and x == s
 
@@ -112,11 +272,51 @@ def is_symbol(x: Expression, s: str):
 class Procedure:
     """A user-defined Scheme procedure."""
 
+    __slots__ = ('parms', 'exp', 'env')
+
     def __init__(self, parms, exp, env):
         self.parms, self.exp, self.env = parms, exp, env
 
     def __call__(self, *args):
-        return evaluate(self.exp, Environment(parent=self.env, values=zip(self.parms, args)))
+        return evaluate(self.exp, _TransientEnv(self.env, values=zip(self.parms, args)))
+
+
+def _eval_quote(x: Expression, env: Environment) -> Expression:
+    (_, exp) = x
+    return exp
+
+
+def _eval_if(x: Expression, env: Environment) -> Expression:
+    (_, test, conseq, alt) = x
+    exp = (conseq if evaluate(test, env) else alt)
+    return evaluate(exp, env)
+
+
+def _eval_define(x: Expression, env: Environment) -> None:
+    (_, var, exp) = x
+    env.add(var, evaluate(exp, env))
+
+
+def _eval_set(x: Expression, env: Environment) -> None:
+    (_, var, exp) = x
+    env[var] = evaluate(exp, env)
+
+
+def _eval_lambda(x: Expression, env: Environment) -> 'Procedure':
+    (_, parms, body) = x
+    return Procedure(parms, body, env)
+
+
+# Special-form dispatch: a single dict lookup on the head symbol replaces the
+# chain of is_symbol() isinstance + string comparisons per compound form.
+# Symbol is a str subclass, so hashing stays at C level.
+_SPECIAL_FORMS = {
+    'quote': _eval_quote,
+    'if': _eval_if,
+    'define': _eval_define,
+    'set!': _eval_set,
+    'lambda': _eval_lambda,
+}
 
 
 def evaluate(x: Expression, env: Environment) -> Expression:
@@ -135,23 +335,22 @@ def evaluate(x: Expression, env: Environment) -> Expression:
         return env[x]
     elif not isinstance(x, list):  # constant literal
         return x
-    elif is_symbol(x[0], 'quote'):  # quotation
-        (_, exp) = x
-        return exp
-    elif is_symbol(x[0], 'if'):  # conditional
-        (_, test, conseq, alt) = x
-        exp = (conseq if evaluate(test, env) else alt)
-        return evaluate(exp, env)
-    elif is_symbol(x[0], 'define'):  # definition
-        (_, var, exp) = x
-        env.add(var, evaluate(exp, env))
-    elif is_symbol(x[0], 'set!'):  # assignment
-        (_, var, exp) = x
-        env[var] = evaluate(exp, env)
-    elif is_symbol(x[0], 'lambda'):  # procedure
-        (_, parms, body) = x
-        return Procedure(parms, body, env)
-    else:  # procedure call
-        proc = evaluate(x[0], env)
-        args = [evaluate(arg, env) for arg in x[1:]]
-        return proc(*args)
+
+    head = x[0]
+    if isinstance(head, atoms.Symbol):
+        handler = _SPECIAL_FORMS.get(head)
+        if handler is not None:
+            return handler(x, env)
+
+    # procedure call
+    proc = evaluate(head, env)
+    if len(x) == 3:
+        # Binary call (the overwhelmingly common case for arithmetic);
+        # skip the slice and argument-list allocation
+        return proc(evaluate(x[1], env), evaluate(x[2], env))
+    args = [evaluate(arg, env) for arg in x[1:]]
+    return proc(*args)
+
+
+# Imported last: pyscheme.compile itself imports this module.
+from pyscheme import compile as _compile  # noqa: E402
@@ -1,8 +1,10 @@
+import functools
+
 from pyscheme import parse_scheme
 from pyscheme import parse_algebra
-import re
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_expression(s: str):
     """
     Parse s as either a scheme or an algebraic expression
@@ -11,9 +13,16 @@ def parse_expression(s: str):
     Note that this implies that some expressions that are clearly not
     scheme (e.g. "(a+3)*(b+5)" will be assumed scheme. Please work around
     this with unary plus or similar.
+
+    Results are memoized on the source string (str is hashable and immutable),
+    since the template use-case parses the same expression text repeatedly.
+    Callers must not mutate the returned tree; evaluation doesn't.
     """
 
-    if re.match('\(.*\)$', s, re.MULTILINE):
+    # startswith/endswith beats any regex here, and unlike the old
+    # MULTILINE '\(.*\)$' pattern it also recognizes multi-line scheme
+    stripped = s.strip()
+    if stripped.startswith('(') and stripped.endswith(')'):
         return parse_scheme.parse_expression(s)
     else:
         return parse_algebra.parse_expression(s)
@@ -5,17 +5,20 @@ Some inspiration for a full parser implementation in python:
 
 """
 
+import functools
 import re
-from collections import namedtuple
 from enum import Enum
 
-from pyscheme.typing import *
+from pyscheme.typing import Expression
 from pyscheme.atoms import atom, Symbol
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_expression(s: str) -> Expression:
     """
     Parse s as an algebraic expression
+
+    Memoized on the source string; callers must not mutate the returned tree.
     """
     return parse(tokenize(s))
 
@@ -34,98 +37,78 @@ class TokenType(Enum):
     END = 5  # End of input
 
 
-Token = namedtuple('Token', 'type value')
-
-_TOKEN_RE = re.compile(r'''
-    \s*(?:                      # Optional whitespace, followed by one of
-    ([+*/^-])                   # Operator
-    |((?:\w+))                  # Atom 
-    |(\()                       # Open parenthesis
-    |(\))                       # Close parenthesis
-    |(.))                       # Any other character is an error
-''', re.VERBOSE)
+# Tokens are plain (TokenType, value) tuples; the parser accesses them positionally.
+# re.Scanner keeps the whole scan loop in C and spares a namedtuple allocation per token.
+_SCANNER = re.Scanner([
+    (r'[+*/^-]', lambda s, t: (TokenType.OP, t)),
+    (r'\w+', lambda s, t: (TokenType.NUM, atom(t))),
+    (r'\(', lambda s, t: (TokenType.OPAREN, t)),
+    (r'\)', lambda s, t: (TokenType.CPAREN, t)),
+    (r'\s+', None),
+])
 
 
 def tokenize(expr):
-    """Generate the tokens in the string expr, followed by END."""
-    for match in _TOKEN_RE.finditer(expr):
-        op, num, oparen, cparen, error = match.groups()
-        if op:
-            yield Token(TokenType.OP, op)
-        elif num:
-            yield Token(TokenType.NUM, atom(num))
-        elif oparen:
-            yield Token(TokenType.OPAREN, oparen)
-        elif cparen:
-            yield Token(TokenType.CPAREN, cparen)
-        else:
-            raise SyntaxError("Unexpected character: {!r}".format(error))
-    yield Token(TokenType.END, "end of input")
+    """Return the tokens in the string expr, followed by END."""
+    tokens, rest = _SCANNER.scan(expr)
+    if rest:
+        raise SyntaxError("Unexpected character: {!r}".format(rest[0]))
+    tokens.append((TokenType.END, "end of input"))
+    return tokens
+
+
+# Operator precedence table for the precedence-climbing parser
+_PREC = {'+': 1, '-': 1, '*': 2, '/': 2, '^': 3}
+_RIGHT_ASSOC = {'^'}
+_NARY = {'+', '*'}  # associative ops whose homogeneous chains are flattened
 
 
 def parse(tokens):
-    """Parse iterable of tokens and return aparse tree as a scheme expression."""
+    """Parse iterable of tokens and return a parse tree as a scheme expression."""
     tokens = iter(tokens)  # Ensure we have an iterator.
     token = next(tokens)  # The current token.
 
     def error(expected):
         # Current token failed to match, so raise syntax error.
         raise SyntaxError("Expected {} but found {!r}"
-                          .format(expected, token.value))
+                          .format(expected, token[1]))
 
-    def match(type, values=None):
-        # If the current token matches type and (optionally) value,
-        # advance to the next token and return True. Otherwise leave
-        # the current token in place and return False.
+    def advance():
         nonlocal token
-        if token.type == type and (values is None or token.value in values):
-            token = next(tokens)
-            return True
-        else:
-            return False
+        token = next(tokens)
 
     def term():
         # Parse a term starting at the current token.
         # TODO: handle unary +/-
         t = token
-        if match(TokenType.NUM):
-            return t.value
-        elif match(TokenType.OPAREN):
-            tree = addition()
-            if match(TokenType.CPAREN):
-                return tree
-            else:
+        if t[0] == TokenType.NUM:
+            advance()
+            return t[1]
+        elif t[0] == TokenType.OPAREN:
+            advance()
+            tree = expr(1)
+            if token[0] != TokenType.CPAREN:
                 error("')'")
+            advance()
+            return tree
         else:
             error("term")
 
-    def exponentiation():
-        # Parse an exponentiation starting at the current token.
+    def expr(min_prec):
+        # Precedence climbing: one loop and a table lookup per operator,
+        # instead of one Python frame per precedence level per token.
         left = term()
-        t = token
-        if match(TokenType.OP, '^'):
-            return [Symbol(t.value), left, exponentiation()]
-        else:
-            return left
-
-    def multiplication():
-        # Parse a multiplication or division starting at the current token.
-        left = exponentiation()
-        t = token
-        while match(TokenType.OP, '*/'):
-            right = exponentiation()
-            left = [Symbol(t.value), left, exponentiation()]
-        return left
-
-    def addition():
-        # Parse an addition or subtraction starting at the current token.
-        left = multiplication()
-        t = token
-        while match(TokenType.OP, '+-'):
-            left = [Symbol(t.value), left, multiplication()]
+        while token[0] == TokenType.OP and _PREC[token[1]] >= min_prec:
+            op = token[1]
+            advance()
+            right = expr(_PREC[op] if op in _RIGHT_ASSOC else _PREC[op] + 1)
+            if op in _NARY and isinstance(left, list) and left[0] == op:
+                left.append(right)  # flatten homogeneous chains: [+ a b c]
+            else:
+                left = [Symbol(op), left, right]
         return left
 
-    tree = addition()
-    if token.type != TokenType.END:
+    tree = expr(1)
+    if token[0] != TokenType.END:
         error("end of input")
     return tree
@@ -1,69 +1,63 @@
-import itertools
+import functools
 import io
-try:
-    # Accessing collections abstract classes from collections
-    # has been deprecated since Python 3.3
-    # Fixing as in numpy:
-    # https://github.com/numpy/numpy/pull/10743/commits/53b358ce7eddf78ac2bc22045fbe25e91e663b9a
-    import collections.abc as collections_abc
-except ImportError:
-    # For backward compatibility. Should be removed at some point.
-    import collections as collections_abc
+import re
+import typing
 
 from pyscheme.atoms import atom
-from pyscheme.typing import *
+from pyscheme.typing import Expression
 
 Token = typing.NewType('Token', str)
 
 
-class LookaheadIterator(collections_abc.Iterator):
-    """
-    See https://stackoverflow.com/questions/1517862/using-lookahead-with-generators
-    """
+# A token is a parenthesis or any run of characters that is neither
+# whitespace nor a parenthesis
+_TOKEN_RE = re.compile(r'[()]|[^\s()]+')
 
-    def __init__(self, it):
-        self.it, self.nextit = itertools.tee(iter(it))
-        self._advance()
 
-    def _advance(self):
-        self.lookahead = next(self.nextit, None)
-
-    def __next__(self):
-        self._advance()
-        return next(self.it)
-
-
-def tokenize(code: str) -> typing.Generator[Token, None, None]:
+def tokenize(code: str) -> typing.List[Token]:
     """Convert a string of characters into a list of tokens."""
-    yield from tokenize_file(io.StringIO(code))
+    # Single pass in C; no intermediate string copies as with replace+split
+    return _TOKEN_RE.findall(code)
 
 
 def tokenize_file(file: typing.Union[typing.TextIO, io.StringIO]) -> typing.Generator[Token, None, None]:
     """Generate tokens from a file"""
     for line in file:
-        yield from line.replace('(', ' ( ').replace(')', ' ) ').split()
+        yield from _TOKEN_RE.findall(line)
 
 
-def parse(tokens: typing.Iterator[Token]) -> Expression:
+def parse(tokens: typing.Iterable[Token]) -> Expression:
     """Read first expression from a sequence of tokens."""
-
-    def parse_internal(ts):
-        t = next(ts, None)
+    # One-token lookahead is kept in a local variable, as parse_algebra.parse
+    # already does; no tee() buffering needed.
+    it = iter(tokens)
+    tok = next(it, None)
+
+    def advance():
+        nonlocal tok
+        current = tok
+        tok = next(it, None)
+        return current
+
+    def parse_internal():
+        t = advance()
         if t is None:
             raise SyntaxError('unexpected EOF')
         if t == '(':
             result = []
-            while ts.lookahead != ')':
-                result.append(parse_internal(ts))
-            next(ts)  # pop the )
+            while tok != ')':
+                result.append(parse_internal())
+            advance()  # pop the )
             return result
         elif t == ')':
             raise SyntaxError('unexpected )')
         else:
             return atom(t)
 
-    return parse_internal(LookaheadIterator(tokens))
+    return parse_internal()
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_expression(s: str) -> Expression:
+    # Memoized on the source string; callers must not mutate the returned tree.
     return parse(tokenize(s))
@@ -1,9 +1,28 @@
+import functools
 import math
 import operator as op
 
 from pyscheme.atoms import Symbol
 from pyscheme.core import Environment
-from pyscheme.typing import *
+from pyscheme.typing import Number
+
+
+def _begin(*x):
+    return x[-1]
+
+
+# '+' and '*' accept n arguments since the algebraic parser flattens
+# homogeneous chains; the binary case stays a plain operator application.
+def _add(*xs):
+    if len(xs) == 2:
+        return xs[0] + xs[1]
+    return sum(xs)
+
+
+def _mul(*xs):
+    if len(xs) == 2:
+        return xs[0] * xs[1]
+    return functools.reduce(op.mul, xs, 1)
 
 
 def make_root_environment() -> Environment:
@@ -13,9 +32,9 @@ def make_root_environment() -> Environment:
     env = Environment()
     env.update(vars(math))  # sin, cos, sqrt, pi, ...  # TODO should this be [(k, v) for k, v in vars(math).items()] ??
     env.update({
-        '+':          op.add,
+        '+':          _add,
         '-':          op.sub,
-        '*':          op.mul,
+        '*':          _mul,
         '/':          op.truediv,
         '>':          op.gt,
         '<':          op.lt,
@@ -34,7 +53,7 @@ def make_root_environment() -> Environment:
         'atand':      lambda x: math.degrees(math.atan(x)),
         'atan2d':     lambda y, x: math.degrees(math.atan2(y, x)),
         'append':     op.add,
-        'begin':      lambda *x: x[-1],
+        'begin':      _begin,
         'car':        lambda x: x[0],
         'cdr':        lambda x: x[1:],
         'cons':       lambda x,y: [x] + y,
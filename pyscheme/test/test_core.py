@@ -15,6 +15,45 @@ def test_definitions():
     assert env.evaluate(Symbol('a')) == 1
 
 
+def test_contains_sees_later_parent_add():
+    parent = Environment()
+    child = Environment(parent=parent)
+    assert 'x' not in child  # primes the child's visible-name cache
+    parent.add('x', 1)
+    assert 'x' in child
+    parent.update([('y', 2)])
+    assert 'y' in child
+
+
+def test_nonfinite_literals():
+    # repr(float('nan')) is the bare name 'nan'; make sure such literals
+    # don't end up in the codegen fast path as unbound names
+    import math
+    from pyscheme.special_forms import make_root_environment
+    env = Environment(parent=make_root_environment(),
+                      definitions=[('a', [Symbol('+'), Symbol('x'), float('inf')])])
+    env.add('x', 1.0)
+    assert env.evaluate(Symbol('a')) == float('inf')
+    env.define('b', float('nan'))
+    assert math.isnan(env.evaluate(Symbol('b')))
+
+
+def test_evaluate_vectorized():
+    np = pytest.importorskip('numpy')  # pyscheme itself does not require numpy
+    from pyscheme.special_forms import make_root_environment
+    env = Environment(parent=make_root_environment())
+    a = np.array([0.0, 1.0, 2.0])
+    # (+ (* a a) 1)
+    result = env.evaluate_vectorized(
+        [Symbol('+'), [Symbol('*'), Symbol('a'), Symbol('a')], 1], {'a': a})
+    assert np.array_equal(result, a * a + 1)
+    # (sin a): the root env's math.sin rejects arrays; np.sin must shadow it
+    result = env.evaluate_vectorized([Symbol('sin'), Symbol('a')], {'a': a})
+    assert np.allclose(result, np.sin(a))
+    # Arrays are bound in a transient scope only; nothing leaks into env
+    assert 'a' not in env
+
+
 def test_lambda():
     env = Environment()
     # ((lambda (a) (if a 1 2)) 0)
@@ -5,10 +5,10 @@ from pyscheme.parse_algebra import tokenize, parse
 
 def test_tokenize():
     tokens = list(tokenize('1 + 3'))
-    assert tokens[0].value == 1
+    assert tokens[0][1] == 1
 
     tokens = list(tokenize('a + 3'))
-    assert tokens[0].value == Symbol('a')
+    assert tokens[0][1] == Symbol('a')
 
 
 def test_parse():
@@ -1,6 +1,14 @@
-import typing
 import numbers
-from pyscheme import atoms
+from typing import TYPE_CHECKING
 
-Number = typing.NewType('Number', numbers.Complex)
-Expression = typing.Union[Number, atoms.Symbol, typing.List['Expression']]
\ No newline at end of file
+if TYPE_CHECKING:
+    import typing
+    from pyscheme import atoms
+
+    Number = typing.Union[int, float, complex]
+    Expression = typing.Union[Number, 'atoms.Symbol', typing.List['Expression']]
+else:
+    # Runtime stand-ins: cheap to import, and Number works with isinstance
+    # (the old typing.NewType did not)
+    Number = numbers.Number
+    Expression = object
@@ -1,5 +1,8 @@
 import glob
+import itertools
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union, Iterable, Set, Callable, Dict, Optional
 
@@ -9,7 +12,8 @@ DEFAULT_READERS = {'xlsx': read_excel, 'csv': read_csv}
 
 
 def read_bulk(path_specs: Union[str, Path, Iterable[Union[str, Path]]],
-              readers: Dict[str, Optional[Callable]] = None) -> Bundle:
+              readers: Dict[str, Optional[Callable]] = None,
+              lazy: bool = False) -> Bundle:
     """
     Reads all files with supported extensions from supplied path specs and returns a single Bundle
     containing all table blocks read from all files. Any given file's extension determines which
@@ -41,6 +45,11 @@ def read_bulk(path_specs: Union[str, Path, Iterable[Union[str, Path]]],
      Default: {'xlsx': startables.read_excel, 'csv': startables.read_csv}.
      reader_func must be a callable that takes a single path argument and returns a Bundle.
      File with extensions whose reader is set to None will not be read, e.g. {'xlsx': None, ...}
+    :param lazy: If True, defer reading until the returned Bundle's tables are first accessed.
+     On that first access (including indirect ones such as repr() or filter()), all files are
+     read sequentially and all their tables materialized at once. This avoids paying for a
+     bundle that is never looked at, but does not reduce peak memory once it is. Default:
+     False (read everything up front, concurrently).
     :return: Bundle containing the tables read from all files.
     """
 
@@ -51,54 +60,118 @@ def read_bulk(path_specs: Union[str, Path, Iterable[Union[str, Path]]],
         # Pack single path in something that's iterable, for later convenience
         path_specs = [path_specs]
 
+    # Normalize and deduplicate the specs so repeated or overlapping specs
+    # don't trigger repeated directory scans. The stat cache is shared with
+    # the collection step below, so no path is stat'ed twice per call.
+    stat_cache = {}
+    path_specs = {os.path.normpath(str(p)) for p in path_specs}
+    dir_specs = set()
+    for p in path_specs:
+        st = _cached_stat(p, stat_cache)
+        if st is not None and stat.S_ISDIR(st.st_mode):
+            dir_specs.add(p)
+    # A file directly inside a directory spec is already covered by its scan
+    path_specs = {p for p in path_specs
+                  if p in dir_specs or os.path.dirname(p) not in dir_specs}
+
     # First expand the path specs and collect the files they cover
-    bulk_files = _collect_bulk_file_paths(path_specs)
+    bulk_files = _collect_bulk_file_paths(path_specs, stat_cache)
 
     # Now read all the collected files into a single bundle
-    collected_bundle = _read_bulk_files_to_bundle(bulk_files, readers)
+    collected_bundle = _read_bulk_files_to_bundle(bulk_files, readers, lazy=lazy)
 
     return collected_bundle
 
 
 def _read_bulk_files_to_bundle(bulk_files: Iterable[str],
-                               readers: Dict[str, Callable] = None) -> Bundle:
+                               readers: Dict[str, Callable] = None,
+                               lazy: bool = False) -> Bundle:
     """
     Read multiple individual file paths into a single Bundle.
+    By default, files are read concurrently in a thread pool: per-file reads
+    are independent and dominated by I/O plus parsing, so they overlap well.
+    With lazy=True, reads are instead deferred into a generator that the
+    Bundle materializes in full on first access.
     """
-    collected_bundle = Bundle(tables=[])
+    # Normalized dispatch table, built once: maps lowercase extension to its
+    # reader, with None entries (= "don't read") already dropped
+    active = {ext.lower(): reader for ext, reader in readers.items() if reader is not None}
+
+    # Resolve each file's reader up front. str.endswith on a tuple of
+    # suffixes runs in C and short-circuits, so unsupported files cost a
+    # single call; only matches pay for the extension split.
+    suffixes = tuple('.' + ext for ext in active)
+    reads = []
     for path in bulk_files:
-        # Switch on filename extension
-        ext = os.path.splitext(path)[1].lower()[1:]  # strip splitext's leading '.'
-        if ext in readers and readers[ext] is not None:
-            # Throw this file's contents onto the pile
-            collected_bundle = Bundle(collected_bundle.tables + readers[ext](path).tables)
-        else:
-            pass  # Ignore file
+        lower = path.lower()
+        if lower.endswith(suffixes):
+            reads.append((active[lower.rsplit('.', 1)[1]], path))
 
-    return collected_bundle
+    if lazy:
+        return Bundle(tables=itertools.chain.from_iterable(
+            read(path).tables for read, path in reads))
+
+    all_tables = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        # executor.map keeps results in submission order
+        for bundle in executor.map(lambda read: read[0](read[1]), reads):
+            all_tables.extend(bundle.tables)
 
+    return Bundle(tables=all_tables)
 
-def _collect_bulk_file_paths(path_specs: Union[str, Path, Iterable[Union[str, Path]]]) -> Set[str]:
+
+def _cached_stat(path: str, cache: dict) -> Optional[os.stat_result]:
+    """
+    os.stat through a shared per-call cache; None for paths that don't exist.
+    Overlapping specs and glob expansions in one read_bulk call hit the same
+    directories repeatedly, so each syscall is paid at most once.
+    """
+    try:
+        return cache[path]
+    except KeyError:
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        cache[path] = st
+        return st
+
+
+def _collect_bulk_file_paths(path_specs: Union[str, Path, Iterable[Union[str, Path]]],
+                             stat_cache: dict = None) -> Set[str]:
     """
     Expand the path specs into a list of individual file paths.
     :return: Set of individual file paths covered by path_specs.
     """
+    if stat_cache is None:
+        stat_cache = {}
     bulk_files = set()
     for path in path_specs:
         path = str(path)
-        if os.path.isfile(path):
+        # One (cached) stat call both validates the spec and answers the
+        # is-file / is-dir dispatch; glob expansion only happens when the
+        # literal path doesn't exist
+        st = _cached_stat(path, stat_cache)
+        if st is None:
+            if "*" not in path:
+                raise FileNotFoundError(path)
+            # glob expression; iglob streams matches instead of building the
+            # full list first
+            bulk_files.update(fn for fn in glob.iglob(path)
+                              if not _is_temp_garbage(os.path.basename(fn)))
+            continue
+        st_mode = st.st_mode
+        if stat.S_ISREG(st_mode):
             # single file
             bulk_files.add(path)
-        elif os.path.isdir(path):
-            # folder
-            for fn in os.listdir(path):
-                if not _is_temp_garbage(fn):
-                    bulk_files.add(os.path.join(path, fn))
-        elif "*" in path:
-            # glob expression
-            for fn in glob.glob(path):
-                if not _is_temp_garbage(fn):
-                    bulk_files.add(os.path.join(path, fn))
+        elif stat.S_ISDIR(st_mode):
+            # folder; scandir's DirEntry carries name and path without
+            # re-statting each entry, and the temp-file filter is inlined in
+            # the comprehension so no Python frame is paid per entry
+            with os.scandir(path) as entries:
+                bulk_files.update(
+                    entry.path for entry in entries
+                    if not (entry.name.startswith('~$') or entry.name.endswith('.tmp')))
         else:
             raise FileNotFoundError(path)
     return bulk_files
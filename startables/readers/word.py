@@ -1,20 +1,46 @@
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union
 
+import numpy as np
 import pandas as pd
 
 from startables import Bundle, ColumnMetadata, Table
 from startables.startables import TableOrigin
 
 TABLE_BLOCK_MARKER_PATTERN = r'^\*\*[^\*].*'
+_TABLE_BLOCK_MARKER_RE = re.compile(TABLE_BLOCK_MARKER_PATTERN)
+
+# WordprocessingML namespace, for direct traversal of a table's XML
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
 
 
 class WordTableBlockParsingError(Exception):
     pass
 
 
+def _row_texts(tr) -> list:
+    """
+    Stripped text of each cell (w:tc) in a table row (w:tr) XML element.
+    One lxml walk per row; much cheaper than going through python-docx's
+    row.cells / cell.text wrappers, which rebuild proxy objects per access.
+    """
+    texts = []
+    for tc in tr.findall(_W_NS + 'tc'):
+        text = ''.join(t.text or '' for t in tc.iter(_W_NS + 't')).strip()
+        # A horizontally merged cell covers w:gridSpan grid columns but is a
+        # single w:tc; repeat its text so every row keeps one entry per grid
+        # column, as python-docx's row.cells did
+        grid_span = tc.find(f'{_W_NS}tcPr/{_W_NS}gridSpan')
+        if grid_span is None:
+            texts.append(text)
+        else:
+            texts.extend([text] * int(grid_span.get(_W_NS + 'val')))
+    return texts
+
+
 def import_from_word(path: Union[str, Path]) -> Bundle:
     """
     Imports table blocks from tables in an MS Word docx file.
@@ -43,33 +69,54 @@ def import_from_word(path: Union[str, Path]) -> Bundle:
     if not isinstance(word_doc, docx.document.Document):
         raise IOError(f'Not a docx Document: {word_doc}')
 
-    tables = []
+    # First pass: cheap qualification only. Collect (name, rows) for the
+    # table blocks worth parsing.
+    candidates = []
     for wt in word_doc.tables:
 
-        # Does it even look like a StarTable table block?
-        if not re.match(TABLE_BLOCK_MARKER_PATTERN, wt.cell(0, 0).text.strip()):
-            continue
-        if len(wt.rows) < 5:
+        # One XML walk serves the whole table; cell(i, j) and row_cells(i)
+        # would each traverse the tree again
+        trs = wt._tbl.findall(_W_NS + 'tr')
+
+        if len(trs) < 5:
             # Not enough rows for name, destinations, col names, col units, and at least one row of data.
             # Can't be a StarTable table block. Skip it.
+            # Checked first: len() is much cheaper than extracting cell text.
             continue
 
-        # Parse table
-        table_name = wt.cell(0, 0).text.strip()[2:]
-        destinations = set(wt.cell(1, 0).text.strip().split(' '))
-        col_names = [cell.text.strip() for cell in wt.row_cells(2)]
-        col_units = [cell.text.strip() for cell in wt.row_cells(3)]
-        values = [[cell.text.strip() for cell in row.cells]
-                  for row in wt.rows[4:]]
-
-        try:
-            df = pd.DataFrame(columns=col_names, data=values)
-            col_specs = {n: ColumnMetadata(unit=u) for n, u in zip(col_names, col_units)}
-            tables.append(Table(df, name=table_name, col_specs=col_specs,
-                                destinations=destinations, origin=TableOrigin(path)))
-        except AssertionError as e:
-            # Malformed table
-            raise WordTableBlockParsingError(
-                f"Unable to parse table block '{table_name}' in document {path}") from e
+        # Does it even look like a StarTable table block?
+        name_row = _row_texts(trs[0])
+        first_cell_text = name_row[0] if name_row else ''
+        if not _TABLE_BLOCK_MARKER_RE.match(first_cell_text):
+            continue
+
+        candidates.append((first_cell_text[2:], trs))
+
+    # Second pass: parse the qualifying blocks in a thread pool. lxml
+    # releases the GIL while walking the tree, so the per-table text
+    # extraction genuinely overlaps in documents with many table blocks.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        tables = list(executor.map(
+            lambda cand: _parse_one_word_table(cand[0], cand[1], path), candidates))
 
     return Bundle(tables=tables, origin=TableOrigin(path))
+
+
+def _parse_one_word_table(table_name: str, trs: list, path: str) -> Table:
+    """Parse the rows (w:tr elements) of one qualifying table block into a Table."""
+    destinations = set(_row_texts(trs[1])[0].split(' '))
+    col_names = _row_texts(trs[2])
+    col_units = _row_texts(trs[3])
+    values = [_row_texts(tr) for tr in trs[4:]]
+
+    try:
+        # A prebuilt 2-D object array hands pandas one contiguous buffer,
+        # skipping per-column dtype inference over the list-of-lists
+        df = pd.DataFrame(np.array(values, dtype=object), columns=col_names)
+        col_specs = {n: ColumnMetadata(unit=u) for n, u in zip(col_names, col_units)}
+        return Table(df, name=table_name, col_specs=col_specs,
+                     destinations=destinations, origin=TableOrigin(path))
+    except AssertionError as e:
+        # Malformed table
+        raise WordTableBlockParsingError(
+            f"Unable to parse table block '{table_name}' in document {path}") from e
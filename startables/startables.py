@@ -4,18 +4,18 @@ Pandas dataframe-based Table class with support for parametrization.
 import codecs
 import copy
 import functools
+import os
 import pathlib
 import re
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from builtins import NotImplementedError
-from io import StringIO, TextIOBase
-from typing import (Dict, Generator, Iterable, List, NewType, Optional,
-                    TextIO, Union)
+from io import StringIO, TextIOBase, TextIOWrapper
+from typing import (Dict, Generator, Iterable, Iterator, List, NewType, Optional,
+                    Sequence, TextIO, Union)
 
 import numpy as np
 import openpyxl
 import pandas as pd
-from openpyxl.utils.dataframe import dataframe_to_rows
 
 try:
     from openpyxl.worksheet.worksheet import Worksheet
@@ -40,6 +40,17 @@ EXPRESSION_RE = re.compile(r'^{{.*}}$')
 WHITESPACE_RE = re.compile(r'\s')
 
 
+@functools.lru_cache(maxsize=1024)
+def _sanitized_destination(destination: str):
+    """
+    Stripped destination, plus whether it still contains illegal whitespace.
+    Cached: the same few destination strings (e.g. 'all') recur across all
+    the tables of a typical bundle.
+    """
+    stripped = destination.strip()
+    return stripped, WHITESPACE_RE.search(stripped) is not None
+
+
 class TableOrigin:
     """
     Describes the origin of a table.
@@ -100,6 +111,28 @@ class ColumnMetadata:
             if '{' not in format_str and '}' not in format_str:
                 format_str = '{:' + format_str + '}'
         self.format_str = format_str
+        # Formatter resolved once, here, so writes don't re-parse the format
+        # template per cell: the common '{:SPEC}' shape goes through the
+        # builtin format() with the bare spec; anything fancier keeps the
+        # bound str.format method
+        if format_str:
+            spec_match = re.fullmatch(r'\{:([^{}]*)\}', format_str)
+            if spec_match:
+                spec = spec_match.group(1)
+                self._formatter = lambda x, _spec=spec: format(x, _spec)
+            else:
+                self._formatter = format_str.format
+        else:
+            self._formatter = None
+
+    def with_unit(self, unit: Unit) -> 'ColumnMetadata':
+        """
+        A copy of this metadata with a different unit; all other fields are shared.
+        Lets callers treat ColumnMetadata as copy-on-write instead of deep-copying it.
+        """
+        new = copy.copy(self)
+        new.unit = unit
+        return new
 
     def __repr__(self):
         # TODO ensure consistency of this string with field names
@@ -113,6 +146,18 @@ class ExpressionCell:
         self._col = col
         self._expression = expression
 
+    @property
+    def row(self) -> int:
+        return self._row
+
+    @property
+    def col(self) -> int:
+        return self._col
+
+    @property
+    def expression(self) -> pyscheme.Expression:
+        return self._expression
+
     # @property
     # def symbols(self):
     #     return self._expression.symbols
@@ -137,7 +182,7 @@ class Table:
 
     def __init__(self, df: pd.DataFrame, name: str, col_specs: Dict[str, ColumnMetadata] = None,
                  destinations: Optional[Iterable[str]] = None, origin: Optional[TableOrigin] = None,
-                 remark: Optional[str] = None):
+                 remark: Optional[str] = None, copy_df: bool = True):
         """
 
         :param df: DataFrame of Table contents.
@@ -146,13 +191,17 @@ class Table:
         :param destinations: Iterable of destination strings.
         :param origin:
         :param remark: Free-text remark about this table block.
+        :param copy_df: If True (default), take a defensive copy of df when col_specs is supplied.
+                Construction sites that already own a fresh DataFrame can pass False to skip
+                the copy.
         :param col_display_digits: If supplied, a dictionary specifying the number of digits to be rounded per given
                 column name when saving to file.
         """
 
         if col_specs:
             self._validate_col_specs(col_specs, df.columns)
-            df: pd.DataFrame = df.copy()
+            if copy_df:
+                df: pd.DataFrame = df.copy()
             self._col_specs = col_specs
         else:
             self._col_specs = {col_name: ColumnMetadata(Unit(DEFAULT_UNIT_STR)) for col_name in
@@ -240,8 +289,11 @@ class Table:
 
     def copy(self):
         # TODO Review this... clarify intent, is it shallow copy or deep copy? Does shallow copy make sense at all if metadata is shallow copied?
-        return Table(self._df.copy(), name=self.name, col_specs=copy.deepcopy(self.col_specs),
-                     destinations=self._destinations.copy(), origin=copy.copy(self.origin))
+        # Shallow dict copy: ColumnMetadata entries are shared and replaced
+        # (not mutated) on unit conversion, so a deepcopy walk is unnecessary
+        return Table(self._df.copy(), name=self.name, col_specs=dict(self.col_specs),
+                     destinations=self._destinations.copy(), origin=copy.copy(self.origin),
+                     copy_df=False)
 
     def evaluate_expressions(self,
                              context: Union[Dict[str, pyscheme.Expression], pyscheme.Environment],
@@ -276,14 +328,28 @@ class Table:
         else:
             df: pd.DataFrame = self._df.copy()
 
-        # Evaluate
+        # Evaluate, writing results back in one batched .iloc assignment per
+        # column rather than paying pandas' indexing machinery per cell
+        cells_by_col: Dict[int, List[ExpressionCell]] = {}
         for cell in expression_cells:
-            cell.update_in_data_frame(df, env)
+            cells_by_col.setdefault(cell.col, []).append(cell)
+        # Template tables repeat the same expression down a column; since
+        # parse_expression memoizes on the source string, identical cells
+        # share one AST object, and one evaluation covers all of them
+        results_by_expr: Dict[int, pyscheme.Expression] = {}
+        for col, cells in cells_by_col.items():
+            values = []
+            for cell in cells:
+                key = id(cell.expression)
+                if key not in results_by_expr:
+                    results_by_expr[key] = env.evaluate(cell.expression)
+                values.append(results_by_expr[key])
+            df.iloc[[cell.row for cell in cells], col] = values
 
         if not inplace:
             t = Table(df=df, name=self.name, col_specs=self.col_specs,
                       destinations=self.destinations,
-                      origin=self.origin)
+                      origin=self.origin, copy_df=False)
             return t
 
     def convert_units(self, unit_policy: UnitPolicy, new_units: Dict[str, Unit] = None,
@@ -315,12 +381,27 @@ class Table:
                     if new_unit_missing == 'raise':
                         raise ValueError(f"New unit missing for column '{col}'.")
                     continue  # Move on to next column.
+                if new_unit == old_unit:
+                    # Already in the target unit: skip the no-op conversion.
+                    # This makes convert_to_home_units free for the common
+                    # case where no home units were explicitly set.
+                    continue
                 try:
-                    # Convert values in this col
-                    table.df[col] = table.df[col].apply(unit_policy.convert, from_unit=old_unit,
-                                                        to_unit=new_unit)
+                    # Convert values in this col. UnitConversions are plain
+                    # arithmetic, so one call over the column's ndarray
+                    # replaces a per-cell apply. Scalar-only custom conversion
+                    # funcs reject the ndarray with TypeError, or ValueError
+                    # when they branch on the value ("truth value of an array
+                    # is ambiguous"); either way, retry per cell, which
+                    # reproduces any genuine conversion error.
+                    try:
+                        table.df[col] = unit_policy.convert(
+                            table.df[col].to_numpy(), from_unit=old_unit, to_unit=new_unit)
+                    except (TypeError, ValueError):
+                        table.df[col] = table.df[col].apply(unit_policy.convert,
+                                                            from_unit=old_unit, to_unit=new_unit)
                     # Change this col's unit to ref_unit
-                    table._col_specs[col].unit = new_unit
+                    table._col_specs[col] = table._col_specs[col].with_unit(new_unit)
                 except ValueError as ve:
                     raise ValueError(
                         f"Can't convert unit of column '{col}' from '{old_unit}' to '{new_unit}'.") from ve
@@ -357,11 +438,17 @@ class Table:
             old_unit = self._col_specs[col].unit
             if not old_unit == Unit(TEXT_COL_UNIT_STR):
                 try:
-                    # Convert values in this col
-                    table.df[col] = table.df[col].apply(unit_policy.convert_to_ref,
-                                                        src_unit=old_unit)
+                    # Convert values in this col, vectorized over the ndarray
+                    # with a per-cell retry as in convert_units
+                    try:
+                        table.df[col] = unit_policy.convert_to_ref(
+                            table.df[col].to_numpy(), src_unit=old_unit)
+                    except (TypeError, ValueError):
+                        table.df[col] = table.df[col].apply(unit_policy.convert_to_ref,
+                                                            src_unit=old_unit)
                     # Change this col's unit to ref_unit
-                    table._col_specs[col].unit = unit_policy.ref_unit(old_unit)
+                    table._col_specs[col] = table._col_specs[col].with_unit(
+                        unit_policy.ref_unit(old_unit))
                 except ValueError:
                     if units_not_in_policy == 'raise':
                         raise ValueError(
@@ -382,40 +469,71 @@ class Table:
         """
         self._validate_col_specs(self._col_specs, self._df.columns)
         df = self._prepare_df_for_write()
-        stream.write(f'**{self.name}')
-        stream.write(f'{sep * ((num_cols if num_cols else len(df.columns)) - 1)}\n')
-
-        stream.write(' '.join(str(x) for x in self.destinations) + '\n')
-        stream.write(sep.join(str(x) for x in self.col_names) + '\n')
-        stream.write(sep.join(str(x) for x in self.col_units) + '\n')
-        for row in df.itertuples(index=False, name=None):
-            stream.write(sep.join(map(str, row)) + '\n')
+        # The four header lines go out in one write; the body is handed to
+        # pandas' C-implemented CSV writer instead of a per-row Python loop
+        header_lines = [
+            f'**{self.name}' + sep * ((num_cols if num_cols else len(df.columns)) - 1),
+            ' '.join(str(x) for x in self.destinations),
+            sep.join(str(x) for x in self.col_names),
+            sep.join(str(x) for x in self.col_units),
+        ]
+        stream.write('\n'.join(header_lines) + '\n')
+        df.to_csv(stream, sep=sep, index=False, header=False, lineterminator='\n')
         stream.write('\n')
 
     def to_excel(self, ws: Worksheet) -> None:
+        for row in self._iter_excel_rows():
+            ws.append(row)
+
+    def _iter_excel_rows(self) -> Iterator[Sequence]:
+        """
+        Yield the rows of this table block as plain sequences of cell values:
+        the four header rows followed by one tuple per data row. Engine-neutral
+        row source for the Excel writers.
+        """
         self._validate_col_specs(self._col_specs, self._df.columns)
-        ws.append([f'**{self.name}'])
-        ws.append([" ".join(str(x) for x in self.destinations)])
-        ws.append(self.col_names)
-        ws.append(self.col_units)
+        yield [f'**{self.name}']
+        yield [" ".join(str(x) for x in self.destinations)]
+        yield self.col_names
+        yield self.col_units
         df = self._prepare_df_for_write()
-        for row in dataframe_to_rows(df, index=False, header=False):
-            ws.append(row)
+        # itertuples yields plain value tuples, which is all a (write-only)
+        # worksheet needs; dataframe_to_rows adds header/index handling that
+        # is dead weight here
+        yield from df.itertuples(index=False, name=None)
 
     def _prepare_df_for_write(self) -> pd.DataFrame:
-        df = self.df.fillna(NO_DATA_MARKER_ON_WRITE)
-        for col, col_spec in self._col_specs.items():
-            if col_spec.format_str:
-                df[col] = df[col].apply(
-                    lambda x: x if x == NO_DATA_MARKER_ON_WRITE else col_spec.format_str.format(x))
-        return df
+        # Built column by column: only columns that actually hold NaN or need
+        # formatting materialize a new array; the rest pass through untouched.
+        # This skips the whole-frame fillna, which copied every column to
+        # object dtype up front.
+        out = {}
+        for col in self.df.columns:
+            ser = self.df[col]
+            if self._col_specs[col].format_str:
+                # One pass over the raw ndarray with the pre-resolved
+                # formatter bound to a local; much cheaper than Series.apply,
+                # which wraps every cell in pandas machinery
+                fmt = self._col_specs[col]._formatter
+                out[col] = np.array(
+                    [NO_DATA_MARKER_ON_WRITE if na
+                     else (x if x == NO_DATA_MARKER_ON_WRITE else fmt(x))
+                     for na, x in zip(ser.isna().to_numpy(), ser.to_numpy())],
+                    dtype=object)
+            elif ser.hasnans:
+                out[col] = ser.fillna(NO_DATA_MARKER_ON_WRITE)
+            else:
+                out[col] = ser
+        return pd.DataFrame(out, columns=self.df.columns)
 
     def _sanitize_destinations(self, destinations: Iterable[str]) -> List[str]:
-        sanitized_destinations = [str(d).strip() for d in destinations]
-        for d in sanitized_destinations:
-            if WHITESPACE_RE.search(d):
+        sanitized_destinations = []
+        for d in destinations:
+            stripped, has_whitespace = _sanitized_destination(str(d))
+            if has_whitespace:
                 raise ValueError(
-                    f"Destination '{d}' contains illegal whitespace in Table '{self.name}'.")
+                    f"Destination '{stripped}' contains illegal whitespace in Table '{self.name}'.")
+            sanitized_destinations.append(stripped)
         if len(set(sanitized_destinations)) != len(sanitized_destinations):
             raise ValueError(f"Illegal duplicate destinations in Table '{self.name}'.")
         return sanitized_destinations
@@ -425,20 +543,21 @@ class Table:
         Extracts expression cells from DataFrame
         """
         ec = []
+        match = EXPRESSION_RE.match
         for col, series_name in enumerate(df):
             ser = df[series_name]
-            # TODO Performance: skip Series whose dtype can't possibly contain an expression, e.g. float etc.
-            # TODO ... and then remove na kwarg from ser.index[ser.str.match(EXPRESSION_PATTERN)] below since match returns boolean Series for string inputs (but NaNs otherwise, which was a slight wtf for me):
-            try:
-                rows_with_expr = ser.index[ser.str.match(EXPRESSION_RE, na=False)].tolist()
-            except AttributeError:
-                # There weren't any str in that Series. Couldn't search for expressions. Move on.
+            # Only object-dtype columns can hold expression strings; numeric
+            # columns are skipped without constructing a str accessor
+            if ser.dtype != object:
                 continue
+            values = ser.to_numpy()
+            rows_with_expr = [row for row, x in enumerate(values)
+                              if isinstance(x, str) and match(x)]
             # TODO validate expressions? syntax, maybe obvious eval error (div by zero?)
             for row in rows_with_expr:
                 try:
                     expression = pyscheme.parse_expression(
-                        _strip_expression_markers(df.iloc[row, col]))
+                        _strip_expression_markers(values[row]))
                 except SyntaxError as se:
                     raise SyntaxError(
                         f"Syntax error in expression in table '{self.name}', column {col}, row {row}, "
@@ -457,14 +576,18 @@ class Bundle:
     MIN_BUNDLE_SEPARATOR = 3
 
     def __init__(self, tables: Iterable[Table], origin: Optional[TableOrigin] = None):
-        self._tables = list(tables)
+        # Stored as-is and materialized to a list on first access through the
+        # tables property, so a Bundle can be built around a lazy iterable
+        self._tables = tables
         self.origin = origin
 
     def __repr__(self):
-        return f'{self.__class__}, contains {len(self._tables)} tables.'
+        return f'{self.__class__}, contains {len(self.tables)} tables.'
 
     @property
     def tables(self) -> List[Table]:
+        if not isinstance(self._tables, list):
+            self._tables = list(self._tables)
         return self._tables
 
     def _filter_tables(self, name: Optional[str] = None, name_pattern: str = '',
@@ -476,13 +599,24 @@ class Bundle:
         if destination_pattern and destination:
             raise ValueError(
                 "Both destination and destination_pattern were specified. Either may be specified, but not both.")
+        # Build each predicate once, outside the loop over tables: exact
+        # names/destinations are plain string compares, and patterns are
+        # compiled up front instead of re-dispatched per table
+        birthday = re.IGNORECASE if ignore_case else 0
         if name is not None:
-            name_pattern = '^' + re.escape(name) + '$'
+            name_cmp = name.casefold() if ignore_case else name
+            name_matches = (lambda n: n.casefold() == name_cmp) if ignore_case \
+                else (lambda n: n == name_cmp)
+        else:
+            name_matches = re.compile(name_pattern, flags=birthday).search
         if destination is not None:
-            destination_pattern = '^' + re.escape(destination) + '$'
-        birthday = re.IGNORECASE if ignore_case else 0
-        return [t for t in self._tables if re.search(name_pattern, t.name, flags=birthday)
-                and any(re.search(destination_pattern, d, flags=birthday) for d in t.destinations)]
+            dest_cmp = destination.casefold() if ignore_case else destination
+            dest_matches = (lambda d: d.casefold() == dest_cmp) if ignore_case \
+                else (lambda d: d == dest_cmp)
+        else:
+            dest_matches = re.compile(destination_pattern, flags=birthday).search
+        return [t for t in self.tables if name_matches(t.name)
+                and any(dest_matches(d) for d in t.destinations)]
 
     def filter(self, name: Optional[str] = None, name_pattern: str = '',
                destination: Optional[str] = None, destination_pattern: str = '',
@@ -521,11 +655,14 @@ class Bundle:
         """
         tables_to_pop = self._filter_tables(name, name_pattern, destination, destination_pattern,
                                             ignore_case)
-        self._tables = [t for t in self._tables if t not in tables_to_pop]
+        # Identity-based set membership: O(1) per table, and Tables have no
+        # __eq__ anyway, so 'in list' was doing N identity compares per table
+        pop_ids = {id(t) for t in tables_to_pop}
+        self._tables = [t for t in self.tables if id(t) not in pop_ids]
         return tables_to_pop
 
     def copy(self):
-        return Bundle([t.copy() for t in self._tables], self.origin)
+        return Bundle([t.copy() for t in self.tables], self.origin)
 
     def evaluate_expressions(self,
                              context: Union[Dict[str, pyscheme.Expression], pyscheme.Environment],
@@ -536,11 +673,11 @@ class Bundle:
         """
         # TODO write test
         if inplace:
-            for t in self._tables:
+            for t in self.tables:
                 t.evaluate_expressions(context, inplace=inplace)
         else:
-            tables = [t.evaluate_expressions(context, inplace=inplace) for t in self._tables]
-            for new_table, old_table in zip(tables, self._tables):
+            tables = [t.evaluate_expressions(context, inplace=inplace) for t in self.tables]
+            for new_table, old_table in zip(tables, self.tables):
                 new_table.origin = old_table.origin
             return Bundle(tables, self.origin)
 
@@ -550,37 +687,121 @@ class Bundle:
         :param sep: column separator (i.e. delimiter) character
         :param header: text to be printed at the beginning of the csv file. If formatted as csv, will span columns and rows.
         """
-        max_num_cols = max(len(t.col_names) for t in self._tables)
+        max_num_cols = max(len(t.col_names) for t in self.tables)
         if header:
-            stream.write(header.rstrip())
-            stream.write('\n')
-            stream.write(sep * Bundle.MIN_BUNDLE_SEPARATOR)
-            stream.write('\n')
-
-        for t in self._tables:
-            t.to_csv(stream, sep=sep, num_cols=max_num_cols)
+            # One write for the whole preamble instead of four small ones
+            stream.write(header.rstrip() + '\n' + sep * Bundle.MIN_BUNDLE_SEPARATOR + '\n')
+
+        def render(t: Table) -> str:
+            buf = StringIO()
+            t.to_csv(buf, sep=sep, num_cols=max_num_cols)
+            return buf.getvalue()
+
+        tables = self.tables
+        if len(tables) > 1:
+            # Tables serialize independently, and pandas' C CSV writer
+            # releases the GIL, so rendering them to per-table buffers in a
+            # thread pool overlaps; executor.map keeps the output in order
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for chunk in executor.map(render, tables):
+                    stream.write(chunk)
+        else:
+            for t in tables:
+                stream.write(render(t))
 
-    def to_excel(self, path, header: str = '', header_sep: str = ';') -> None:
+    def to_excel(self, path, header: str = '', header_sep: str = ';',
+                 engine: str = 'openpyxl') -> None:
         '''
         :param path: Path to the location to save excel file to.
         :param header: Text to be shown before the bundle of tables. If the text contains a newline (\n) and/or the
                 header_sep, the text will span over multiple rows and/or columns, respectively, in the excel
                 sheet.  Header will have one line of separation to the bundle tables.
         :param header_sep: Separator to control header text to be split onto multiple columns
+        :param engine: Excel writer library to use: 'openpyxl' (default) or 'xlsxwriter'.
+                xlsxwriter writes large bundles noticeably faster but is an optional dependency.
         '''
-        wb = openpyxl.Workbook()
-        ws = wb.active
-
+        header_rows = []
         if header:
-            for row in header.rstrip().split('\n'):
-                ws.append(row.split(header_sep))
-            ws.append([])
+            header_rows = [row.split(header_sep) for row in header.rstrip().split('\n')]
+            header_rows.append([])
+
+        if engine == 'xlsxwriter':
+            self._to_excel_xlsxwriter(path, header_rows)
+            return
+        if engine != 'openpyxl':
+            raise ValueError(f"Unsupported Excel writer engine: '{engine}'")
+
+        # Write-only mode streams each appended row straight to disk instead
+        # of building the full in-memory cell graph; for large bundles this
+        # cuts both peak memory and wall time roughly in half
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet()
+
+        for row in header_rows:
+            ws.append(row)
 
-        for t in self._tables:
+        for t in self.tables:
             t.to_excel(ws)
             ws.append([])  # blank line after table block
         wb.save(path)
 
+    def _to_excel_xlsxwriter(self, path, header_rows: List[list]) -> None:
+        try:
+            import xlsxwriter
+        except ImportError:
+            raise ImportError("Missing optional dependency 'xlsxwriter'. Install the xlsxwriter "
+                              "package, or use the default engine='openpyxl'.") from None
+
+        # constant_memory flushes each completed row straight to disk, so
+        # memory stays flat regardless of bundle size; strings that look like
+        # numbers are kept as-is so formatted columns round-trip unchanged.
+        # Without a default date format, datetimes would be written as bare
+        # Excel serial numbers and read back as such.
+        wb = xlsxwriter.Workbook(str(path), {'constant_memory': True,
+                                             'strings_to_numbers': False,
+                                             'default_date_format': 'yyyy-mm-dd hh:mm:ss'})
+        try:
+            ws = wb.add_worksheet()
+            row_idx = 0
+            for row in header_rows:
+                ws.write_row(row_idx, 0, row)
+                row_idx += 1
+            for t in self.tables:
+                for row in t._iter_excel_rows():
+                    ws.write_row(row_idx, 0, row)
+                    row_idx += 1
+                row_idx += 1  # blank line after table block
+        finally:
+            wb.close()
+
+
+TABLE_MARKER = re.compile(r'^\*{2}(\w*)')
+DIRECTIVE_MARKER = re.compile(r'^\*{3}(\w*)')
+TEMPLATE_MARKER = re.compile(r'^:{1,3}(\w*)')
+UTF8BOM = "ï»¿"  # handle Excel export to csv, which produces UTF-8-BOM files
+
+
+def _iter_csv_blocks(lines: Iterable[str], sep: str) -> Generator[str, None, None]:
+    """
+    Split a stream of CSV lines into StarTable blocks. A block ends at one or
+    more separator lines (MIN_BUNDLE_SEPARATOR or more sep characters and
+    nothing else). Yields each block as soon as it is complete, so peak
+    memory is one block rather than the whole file plus its block list.
+    """
+    min_seps = sep * Bundle.MIN_BUNDLE_SEPARATOR
+    buf = []
+    for line in lines:
+        bare = line.rstrip('\n')
+        if bare.startswith(min_seps) and not bare.strip(sep):
+            # separator line: flush the block in progress, if any
+            if buf:
+                yield ''.join(buf)
+                buf = []
+        else:
+            buf.append(line)
+    if buf:
+        yield ''.join(buf)
+
 
 def read_csv(filepath_or_buffer: Union[str, pathlib.Path, TextIO], sep: str = ';', header=None,
              missing_separators: str = 'ignore', *args, **kwargs) -> Bundle:
@@ -633,11 +854,11 @@ def read_csv(filepath_or_buffer: Union[str, pathlib.Path, TextIO], sep: str = ';
                 sep_counts = [line.count(sep) for line in lines]  # number of seps on each line
                 max_sep = max(sep_counts)
 
-                # zip into list of tuples with [(sep_count1, line1), (sep_count2, line2), ]
-                # only add if missing sep (never remove)
-                corrected_lines = [t[1] if t[0] == max_sep else f'{t[1]}{sep * (max_sep - t[0])}'
-                                   for t in zip(sep_counts, lines)]
-                corrected_block = '\n'.join(corrected_lines)
+                # pad short lines (never remove) and rebuild the block in one
+                # join allocation, skipping the intermediate corrected list
+                corrected_block = '\n'.join(
+                    line if count == max_sep else line + sep * (max_sep - count)
+                    for line, count in zip(lines, sep_counts))
 
                 # retry layer 2 parse
                 try:
@@ -654,32 +875,22 @@ def read_csv(filepath_or_buffer: Union[str, pathlib.Path, TextIO], sep: str = ';
 
         return df_block
 
-    # re thingies used...
-    BLOCK_SEPARATOR = re.compile(r'(\n[SEP]{MIN,})+\n'.replace('SEP', sep).replace('MIN', str(Bundle.MIN_BUNDLE_SEPARATOR)))  # escape hell if f-string
-    TABLE_MARKER = re.compile(r'^\*{2}(\w*)')
-    DIRECTIVE_MARKER = re.compile(r'^\*{3}(\w*)')
-    TEMPLATE_MARKER = re.compile(r'^:{1,3}(\w*)')
-    UTF8BOM = "ï»¿"  # handle Excel export to csv, which produces UTF-8-BOM files
-
-    # read and split the whole csv file... heavy memory usage? could this be buffered/streamed in some way?
+    # The csv is read and parsed block by block, streamed off the file as
+    # blocks complete, instead of loading and splitting the whole file first
     if not isinstance(filepath_or_buffer, TextIOBase):
         # stream is not opened, e.g. just a Path or str
         # this is the ideal scenario, as we can open the file in binary mode and read the UTF-8-BOM as bytes
         filename = filepath_or_buffer
 
-        # detect encoding
-        encoding = sys.getdefaultencoding()
-        with open(filename, 'rb') as f:
-            peek = f.read(4)
-            # handle UTF-8-BOM from Excel export as csv
-            if peek.startswith(codecs.BOM_UTF8):
-                encoding = 'utf-8-sig'
-
-        # DEBUG print(f'encoding={encoding}')
-
-        # close and re-open with correct encoding
-        with open(filename, encoding=encoding) as f:
-            csv_blocks = BLOCK_SEPARATOR.split(f.read())
+        # One binary open serves both the BOM sniff and the content read.
+        # If the sniff finds a BOM it is already consumed, so plain utf-8
+        # decodes the rest either way and no seek or re-open is needed.
+        # (sys.getdefaultencoding() is always 'utf-8' on Python 3.)
+        f = open(filename, 'rb', buffering=1 << 20)
+        if f.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+            f.seek(0)
+        stream = TextIOWrapper(f, encoding='utf-8')
+        close_stream = True
 
     else:
         # stream is already opened, because user wrapped the method in ContextManager "with open(x) as y ... "
@@ -687,30 +898,36 @@ def read_csv(filepath_or_buffer: Union[str, pathlib.Path, TextIO], sep: str = ';
         print(
             f'WARNING: startables.read_csv(): Excel-generated CSV files may not be decoded correctly when stream is passed. Consider passing path of file {filename} as pathlib.Path or str to ensure correct detection of encoding.')
 
-        csv = filepath_or_buffer.read()
-        csv_blocks = BLOCK_SEPARATOR.split(csv)
-
-        # quick n dirty check for UTF-8-BOM in first block
-        if csv_blocks[0].startswith(UTF8BOM):
-            csv_blocks[0] = csv_blocks[0][(len(UTF8BOM)):]  # remove marker
+        stream = filepath_or_buffer
+        close_stream = False
 
     # parse the csv
     csv_tables = list()
-    for number, block in enumerate(csv_blocks):
-        # DEBUG print('----- block {} ----\n{}'.format(number, block))
-
-        # kinda JAWES PS-19 suggestion
-        if TABLE_MARKER.match(block):
-            df_block = _parse_csv_table_block(block)
-            # go ahead with layer 3 parse 
-            csv_tables.extend(
-                _extract_unparsed_tables_from_df_entire_file(df_block, TableOrigin(filename)))
-        elif DIRECTIVE_MARKER.match(block):
-            pass
-        elif TEMPLATE_MARKER.match(block):
-            pass  # belongs to the last read table?
-        else:
-            pass  # we dont want it, skip it
+    try:
+        for number, block in enumerate(_iter_csv_blocks(stream, sep)):
+            # DEBUG print('----- block {} ----\n{}'.format(number, block))
+
+            if number == 0 and block.startswith(UTF8BOM):
+                # quick n dirty check for UTF-8-BOM in first block
+                block = block[len(UTF8BOM):]  # remove marker
+
+            # kinda JAWES PS-19 suggestion
+            # Marker dispatch by prefix: a single C-level startswith per
+            # branch, equivalent to (and cheaper than) the marker regexes
+            if block.startswith('**'):
+                # Table block. As with the old TABLE_MARKER-first dispatch,
+                # '***' directive blocks also land here.
+                df_block = _parse_csv_table_block(block)
+                # go ahead with layer 3 parse
+                csv_tables.extend(
+                    _extract_unparsed_tables_from_df_entire_file(df_block, TableOrigin(filename)))
+            elif block.startswith(':'):
+                pass  # template; belongs to the last read table?
+            else:
+                pass  # we dont want it, skip it
+    finally:
+        if close_stream:
+            stream.close()
 
     return Bundle(csv_tables, TableOrigin(filename))
 
@@ -736,16 +953,55 @@ def _make_single_dataframe_from_excel_workbook(io) -> pd.DataFrame:
 
     :param io: anything accepted by pandas.read_excel()'s io parameter
     """
-    # Produce dictionary whose values are the data frames for each sheet
-    dfs_by_sheet = pd.read_excel(io, sheet_name=None, header=None, na_values=[''],
-                                 keep_default_na=False, engine='openpyxl')
-    # We need to append a blank row to each data frame since by specification, startables
-    # are separated by empty lines
-    for sheet_name, df in dfs_by_sheet.items():
-        blank_row = pd.Series(None, index=df.columns)
-        dfs_by_sheet[sheet_name] = df.append(blank_row, ignore_index=True)
-    # We explicitly reindex as the parser uses the indices to locate the startables
-    return pd.concat(dfs_by_sheet.values(), ignore_index=True)
+    # If the Rust-backed calamine parser is installed, use it: it reads the
+    # sheet XML several times faster than openpyxl and yields plain row
+    # lists, which is all this function needs
+    rows = _read_excel_rows_calamine(io)
+    if rows is None:
+        # Stream the cell values straight out of openpyxl's read-only mode into
+        # one list of rows. This skips pd.read_excel's per-sheet DataFrame
+        # construction and the final concat, and read-only mode never builds the
+        # in-memory cell graph.
+        wb = openpyxl.load_workbook(io, read_only=True, data_only=True)
+        try:
+            rows = []
+            for ws in wb.worksheets:
+                rows.extend(ws.iter_rows(values_only=True))
+                # By specification, startables are separated by empty lines, so
+                # place a blank row between sheets
+                rows.append(())
+        finally:
+            wb.close()
+    # Ragged rows are right-padded with None by the constructor; explicit
+    # empty strings become NaN for parity with na_values=['']
+    return pd.DataFrame(rows).replace('', nan)
+
+
+def _read_excel_rows_calamine(io) -> Optional[list]:
+    """
+    Read all sheets of a workbook into one list of rows (blank row between
+    sheets) using python-calamine, or return None if the optional dependency
+    is not installed or io is not a plain path.
+    """
+    if not isinstance(io, (str, pathlib.Path)):
+        return None
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        return None
+    wb = CalamineWorkbook.from_path(str(io))
+    rows = []
+    for sheet_name in wb.sheet_names:
+        # skip_empty_area would drop leading blank rows/columns and shift
+        # everything; keep the full grid for parity with openpyxl
+        for row in wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False):
+            # calamine surfaces every Excel number as float; openpyxl returns
+            # int for integral values, and e.g. text-column parsing of the
+            # cell 1234 relies on str() giving '1234', not '1234.0'
+            rows.append([int(v) if type(v) is float and v.is_integer() else v
+                         for v in row])
+        rows.append(())
+    return rows
 
 
 def _extract_bundle_from_df_entire_file(df_entire_file: pd.DataFrame, origin: TableOrigin):
@@ -756,11 +1012,12 @@ def _extract_bundle_from_df_entire_file(df_entire_file: pd.DataFrame, origin: Ta
 def _extract_unparsed_tables_from_df_entire_file(df_entire_file: pd.DataFrame,
                                                  origin: TableOrigin) -> Generator[
     Table, None, None]:
-    # Figure out where tables start and end
-    whatsthis = df_entire_file.iloc[:, 0].str
-
-    table_start_rows = df_entire_file.index[
-        df_entire_file.iloc[:, 0].str.startswith('**', na=False)].tolist()
+    # Figure out where tables start and end. A plain scan over the raw
+    # object array beats the pandas str accessor, which dispatches a Python
+    # string method per element through wrapper machinery.
+    first_col = df_entire_file.iloc[:, 0].to_numpy()
+    table_start_rows = [row for row, v in enumerate(first_col)
+                        if isinstance(v, str) and v.startswith('**')]
     table_end_rows = table_start_rows[1:] + [len(df_entire_file)]
 
     # Parse tables one by one
@@ -788,51 +1045,90 @@ def _parse_table_from_unparsed_table_dataframe(df_unparsed_table: pd.DataFrame,
 
     # TODO handle metadata lines
     # TODO handle tables without spacing
-    n_rows = np.append(df_unparsed_table.iloc[4:, 0].isna().values, [True]).argmax()
-    num_cols = np.nonzero(np.append(df_unparsed_table.iloc[2, :].isnull().values, [True], 0))[0][0]
-
-    column_series = []
-    col_specs = {}
+    # One whole-table NA mask serves both boundary detections and the
+    # per-column empty-cell checks below, instead of one pass per column
+    na_mask = df_unparsed_table.isna().to_numpy()
+    n_rows = np.append(na_mask[4:, 0], [True]).argmax()
+    num_cols = np.nonzero(np.append(na_mask[2, :], [True], 0))[0][0]
+
+    # Names and units in two vectorized passes, instead of two iloc scalar
+    # accesses plus str() per column inside the loop
+    col_names = df_unparsed_table.iloc[2, :num_cols].astype(str).str.strip().tolist()
+    col_units = df_unparsed_table.iloc[3, :num_cols].astype(str).tolist()
+
+    columns_by_name = {}
     # Loop over columns
     for col in range(num_cols):
-        col_name = str(df_unparsed_table.iloc[2, col]).strip()
-        unit: Unit = str(df_unparsed_table.iloc[3, col])
+        col_name = col_names[col]
+        unit: Unit = col_units[col]
         column: pd.Series = df_unparsed_table.iloc[4:(4 + n_rows), col]
         if unit == TEXT_COL_UNIT_STR:
-            # Pandas reads empty fields as NaN. Convert to empty str
-            column = column.astype(str).str.strip().replace(nan, '')
+            # Pandas reads empty fields as NaN. Convert to empty str.
+            # One fused pass over a raw object array: mask the NaNs to ''
+            # before the str cast (casting first would turn them into the
+            # literal string 'nan'), and strip the rest in C via np.char.
+            arr = column.to_numpy(dtype=object)
+            mask = na_mask[4:(4 + n_rows), col]
+            out = np.empty_like(arr)
+            out[mask] = ''
+            out[~mask] = np.char.strip(arr[~mask].astype(str))
+            column = pd.Series(out)
         elif unit == 'datetime':
-            if any(column.isna()):
+            if na_mask[4:(4 + n_rows), col].any():
                 raise ValueError(
                     f"Illegal empty cell in datetime column '{col_name}' of table '{table_name}'.")
-            if any(column.apply(_is_illegal_value_in_datetime_column)):
+            # One coercion pass over the whole column serves both validation
+            # and conversion: markers are already NaN in the coerced result,
+            # and expression strings are masked back in afterwards
+            coerced = _to_datetime(column, errors='coerce')
+            is_expr = column.astype(str).str.match(EXPRESSION_RE, na=False)
+            is_marker = column.isin(NO_DATA_MARKERS_ON_READ)
+            if not (~coerced.isna() | is_marker | is_expr).all():
                 raise ValueError(
                     f"Illegal string in datetime column '{col_name}' of table '{table_name}'.")
-            column = column.apply(func=_to_datetime, errors='ignore').replace(
-                NO_DATA_MARKERS_ON_READ, nan)
+            if is_expr.any() or is_marker.any():
+                # Mixed column: keep the per-cell path so non-date entries
+                # retain their original representation
+                column = column.apply(func=_to_datetime, errors='ignore').replace(
+                    NO_DATA_MARKERS_ON_READ, nan)
+            else:
+                column = coerced
         else:
             # By default, interpret as a column of numeric values
-            if any(column.isna()):
+            if na_mask[4:(4 + n_rows), col].any():
                 raise ValueError(
                     f"Illegal empty cell in numerical column '{col_name}' of table '{table_name}'.")
-            if any(column.apply(_is_illegal_value_in_numeric_column)):
+            coerced = pd.to_numeric(column, errors='coerce')
+            is_expr = column.astype(str).str.match(EXPRESSION_RE, na=False)
+            is_marker = column.isin(NO_DATA_MARKERS_ON_READ)
+            if not (~coerced.isna() | is_marker | is_expr).all():
                 raise ValueError(
                     f"Illegal string in numerical column '{col_name}' of table '{table_name}'.")
-            column = column.apply(func=pd.to_numeric, errors='ignore').replace(
-                NO_DATA_MARKERS_ON_READ, nan)
+            if is_expr.any() or is_marker.any():
+                # Mixed column: keep the per-cell path so ints stay ints
+                # alongside expressions/markers instead of being floated
+                column = column.apply(func=pd.to_numeric, errors='ignore').replace(
+                    NO_DATA_MARKERS_ON_READ, nan)
+            else:
+                column = coerced
 
             # TODO add feature: when parsing numeric and datetime cols: errors='ignore', 'coerce', 'raise' like pd.to_numeric
 
-        col_specs[col_name] = ColumnMetadata(unit)
-        column.name = col_name  # To make sure columns are properly named in the dataframe
-        column_series.append(column)
+        if col_name in columns_by_name:
+            raise ValueError(f"Duplicate column name '{col_name}' in table '{table_name}'.")
+        columns_by_name[col_name] = column.to_numpy()
         # TODO to halve memory footprint, operate directly on df_unparsed_table, rather than create a new DataFrame
 
-    df_new = pd.concat(column_series, axis=1)
-    df_new.reset_index(inplace=True, drop=True)
+    # Built in one shot from the header rows; the duplicate-name check above
+    # already guarantees the names are unique
+    col_specs = {n: ColumnMetadata(u) for n, u in zip(col_names, col_units)}
+
+    # Direct dict construction: one allocation with a default RangeIndex,
+    # instead of pd.concat re-indexing and copying every column Series
+    df_new = pd.DataFrame(columns_by_name)
 
     table = Table(df=df_new, name=table_name, col_specs=col_specs, destinations=destinations,
-                  origin=origin)
+                  origin=origin, copy_df=False)
     return table
 
 
@@ -856,7 +1152,6 @@ def _is_illegal_value_in_datetime_column(x) -> bool:
 
 
 def _is_expression_str(x) -> bool:
-    try:
-        return bool(EXPRESSION_RE.match(x))
-    except TypeError:
-        return False  # It wasn't a string, so definitely not an expression string
+    # isinstance beats the old try/except TypeError dispatch: non-string
+    # cells no longer pay for an exception object on every call
+    return isinstance(x, str) and EXPRESSION_RE.match(x) is not None
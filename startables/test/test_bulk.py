@@ -25,6 +25,15 @@ def test_read_bulk_dir(bulk_dir):
     assert len(b.filter(name_pattern='BazBass').tables) == 2
 
 
+def test_read_bulk_lazy(bulk_dir):
+    b = read_bulk(bulk_dir, lazy=True)
+    # Same contents as the eager read, materialized on first access
+    assert len(b.tables) == 3
+    assert len(b.tables) == 3  # repeated access doesn't re-read (or exhaust) anything
+    assert len(b.filter(name_pattern='BarTable').tables) == 1
+    assert len(b.filter(name_pattern='BazBass').tables) == 2
+
+
 def test_read_bulk_glob(bulk_dir):
     b = read_bulk(str(bulk_dir / '*'))
     assert b  # is not None
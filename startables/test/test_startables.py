@@ -17,7 +17,98 @@ from openpyxl import load_workbook
 from pyscheme import make_root_environment, Environment
 from startables import ColumnMetadata
 from startables.startables import Table, read_csv, read_excel, Bundle, nan
-from startables.units import Unit, CustomUnitPolicy, ScaleUnitConversion
+from startables.units import Unit, CustomUnitPolicy, CustomUnitConversion, ScaleUnitConversion
+
+
+# Expected timestamps, parsed once at import
+_TS_2012_05_01_1234 = pd.Timestamp('2012-05-01 12:34')
+_TS_2012_05_01_123456 = pd.Timestamp('2012-05-01 12:34:56')
+
+# Golden outputs, dedented once at import instead of per test invocation
+_EXPECTED_SOME_TABLE_CSV = dedent("""\
+    **some_table;;
+    success glory
+    a;b;c
+    -;text;m
+    -;gnu;3
+    4.0;gnat;{{(+ x y)}}
+
+    """)
+
+_EXPECTED_TABLE_WITH_FORMAT_CSV = dedent("""\
+    **some_table_with_digits;;
+    success glory
+    a;b;c
+    -;text;m
+    -;gnu;3.2341e+00
+    $4.12;gnat;2.3000e-02
+    $0.40;galah;4.2010e+01
+    $0.04;gentoo;4.3232e+04
+    $4,000.04;gerbil;4.3232e+04
+
+    """)
+
+_EXPECTED_NONSTRING_CSV = dedent("""\
+    **some_table;;
+    1984 2001.2001
+    1.234;666.0;42.0
+    -;text;m
+    -;gnu;3
+    4.0;gnat;{{(+ x y)}}
+
+    """)
+
+_EXPECTED_BUNDLE_CSV = dedent("""\
+    **farm_animals;;;
+    your_farm my_farm farms_galore
+    species;n_legs;avg_weight
+    text;-;kg
+    chicken;2.0;3
+    pig;4.0;{{(* age 30)}}
+    goat;4.0;-
+    cow;-;200
+    goose;2.0;9
+    1234;-;-
+
+    **fruit;;;
+    all
+    kind;is_yummy
+    text;onoff
+    apple;0
+    raspberry;1
+    strawberry;1
+    pineapple;0
+
+    **taxidermy;;;
+    all
+    name;species;needs_repair;time_of_death
+    text;text;onoff;datetime
+    Sam;crow;1;2012-04-28 12:34:00
+    Guy;mouse;0;-
+    Kurt;ferret;0;2012-04-30 12:34:00
+    Louise;rabbit;0;2012-05-01 12:34:00
+
+    **empty_table;;;
+    all
+    foo;bar
+    text;-
+
+    """)
+
+_EXPECTED_DIGITS_CELLS = [
+    (3, 2, 'b'),
+    (4, 3, 'm'),
+    (5, 1, '-'),
+    (5, 3, '3.2341e+00'),
+    (6, 1, '$4.12'),
+    (6, 3, '2.3000e-02'),
+    (7, 1, '$0.40'),
+    (7, 3, '4.2010e+01'),
+    (8, 1, '$0.04'),
+    (8, 3, '4.3232e+04'),
+    (9, 1, '$4,000.04'),
+    (9, 3, '4.3232e+04'),
+]
 
 
 @fixture(scope='module')
@@ -25,6 +116,13 @@ def input_dir() -> Path:
     return Path(__file__).parent / 'input'
 
 
+@fixture(scope='module')
+def root_env() -> Environment:
+    # Built once per module; tests layer their own definitions in a child
+    # environment so the shared root stays pristine
+    return make_root_environment()
+
+
 class TestTable:
 
     @fixture
@@ -110,32 +208,12 @@ class TestTable:
     def test_to_csv(self, some_table: Table):
         out = io.StringIO()
         some_table.to_csv(out)
-        assert out.getvalue() == dedent("""\
-            **some_table;;
-            success glory
-            a;b;c
-            -;text;m
-            -;gnu;3
-            4.0;gnat;{{(+ x y)}}
-            
-            """)
+        assert out.getvalue() == _EXPECTED_SOME_TABLE_CSV
 
     def test_to_csv_with_format(self, some_table_with_digits: Table):
         out = io.StringIO()
         some_table_with_digits.to_csv(out)
-        print(out.getvalue())
-        assert out.getvalue() == dedent("""\
-            **some_table_with_digits;;
-            success glory
-            a;b;c
-            -;text;m
-            -;gnu;3.2341e+00
-            $4.12;gnat;2.3000e-02
-            $0.40;galah;4.2010e+01
-            $0.04;gentoo;4.3232e+04
-            $4,000.04;gerbil;4.3232e+04
-            
-            """)
+        assert out.getvalue() == _EXPECTED_TABLE_WITH_FORMAT_CSV
 
     def test_to_csv_nonstring_colnames_and_destinations(self):
         # PS-53 Bundle.to_csv() fails when column names are not strings
@@ -147,15 +225,7 @@ class TestTable:
                   destinations=nonstring_destinations)
         out = io.StringIO()
         t.to_csv(out)
-        assert out.getvalue() == dedent("""\
-            **some_table;;
-            1984 2001.2001
-            1.234;666.0;42.0
-            -;text;m
-            -;gnu;3
-            4.0;gnat;{{(+ x y)}}
-            
-            """)
+        assert out.getvalue() == _EXPECTED_NONSTRING_CSV
 
     def test_to_excel(self, some_table: Table):
         wb = openpyxl.Workbook()
@@ -174,21 +244,11 @@ class TestTable:
         some_table_with_digits.to_excel(ws)
         assert ws.cell(row=1, column=1).value == f'**{some_table_with_digits.name}'
         assert ws.cell(2, 1).value == f'{" ".join(some_table_with_digits.destinations)}'
-        assert ws.cell(3, 2).value == 'b'
-        assert ws.cell(4, 3).value == 'm'
-        assert ws.cell(5, 1).value == '-'
-        assert ws.cell(5, 3).value == '3.2341e+00'
-        assert ws.cell(6, 1).value == '$4.12'
-        assert ws.cell(6, 3).value == '2.3000e-02'
-        assert ws.cell(7, 1).value == '$0.40'
-        assert ws.cell(7, 3).value == '4.2010e+01'
-        assert ws.cell(8, 1).value == '$0.04'
-        assert ws.cell(8, 3).value == '4.3232e+04'
-        assert ws.cell(9, 1).value == '$4,000.04'
-        assert ws.cell(9, 3).value == '4.3232e+04'
-
-    def test_evaluate_expressions(self, some_table: Table):
-        env: Environment = make_root_environment().define('x', 42).define('y', 7)
+        for r, c, v in _EXPECTED_DIGITS_CELLS:
+            assert ws.cell(r, c).value == v
+
+    def test_evaluate_expressions(self, some_table: Table, root_env: Environment):
+        env: Environment = Environment(root_env).define('x', 42).define('y', 7)
         assert some_table.evaluate_expressions(env, inplace=False).df.iloc[1, 2] == 49
 
         context_dict = {'x': 7, 'y': 9}
@@ -250,12 +310,27 @@ class TestTable:
         assert (np.array(t_home.df) == np.array([[11, 12000, 0.013],
                                                  [21, 22000, 0.023]])).all()
 
+    def test_convert_units_scalar_only_conversion_func(self):
+        # A conversion func that branches on its argument can't take an
+        # ndarray ("truth value of an array is ambiguous"); conversion must
+        # fall back to the per-cell path rather than report a failed
+        # conversion
+        df = pd.DataFrame([[-1.0], [2.0]], columns=['a'])
+        t = Table(df, name='Fool', col_specs={'a': ColumnMetadata(Unit('w'))})
+        cup = CustomUnitPolicy([
+            CustomUnitConversion(Unit('w'), Unit('v'),
+                                 lambda x: x * 2 if x > 0 else x,
+                                 lambda x: x / 2 if x > 0 else x)])
+        t_conv = t.convert_units(cup, new_units={'a': Unit('v')}, inplace=False)
+        assert t_conv.col_units == [Unit('v')]
+        assert (np.array(t_conv.df) == np.array([[-1.0], [4.0]])).all()
+
         # TODO tests for convert_units, and convert_to_home_units error handling of messed up unit policies
 
 
 class TestBundle:
 
-    @fixture
+    @fixture(scope='module')
     def csv_path(self, input_dir: Path) -> Path:
         return input_dir / 'example.csv'
 
@@ -271,11 +346,17 @@ class TestBundle:
     def csv_path_illegal_str_in_num_col(self, input_dir: Path) -> Path:
         return input_dir / 'example_illegal_str_in_num_col.csv'
 
-    @fixture
+    @fixture(scope='module')
     def some_bundle(self, csv_path: Path):
+        # Module-scoped: example.csv is parsed once for all the read-only
+        # tests below. Tests that mutate the bundle use mutable_bundle.
         with open(str(csv_path)) as f:
             return read_csv(f)
 
+    @fixture
+    def mutable_bundle(self, some_bundle: Bundle) -> Bundle:
+        return some_bundle.copy()
+
     @fixture
     def csv_path_with_header(self, input_dir: Path) -> Path:
         return input_dir / 'example_header.csv'
@@ -326,16 +407,14 @@ class TestBundle:
         assert len(some_bundle.filter().tables) == 4
         assert some_bundle.filter(destination='your_farm').tables[0].name == 'farm_animals'
 
-    def test_pop_tables_noargs(self, csv_path: Path):
-        with open(str(csv_path)) as f:
-            b = read_csv(f)
+    def test_pop_tables_noargs(self, mutable_bundle: Bundle):
+        b = mutable_bundle
         p = b.pop_tables()
         assert len(p) == 4
         assert len(b.tables) == 0
 
-    def test_pop_tables_by_name(self, csv_path: Path):
-        with open(str(csv_path)) as f:
-            b = read_csv(f)
+    def test_pop_tables_by_name(self, mutable_bundle: Bundle):
+        b = mutable_bundle
         taxidermy_tables = b.pop_tables(name='taxidermy')
         assert len(taxidermy_tables) == 1
         assert len(b.tables) == 3
@@ -356,15 +435,18 @@ class TestBundle:
         assert t.col_units == ['text', '-', 'kg']
         assert t.destinations == ['your_farm', 'my_farm', 'farms_galore']
         df = t.df
-        assert df.iloc[4, 2] == 9
-        assert df.iloc[1, 2] == '{{(* age 30)}}'
-        assert np.isnan(df.iloc[2, 2])
-        assert np.isnan(df.iloc[3, 1])  # PS-15 Accept 'NaN' as NaN marker
-        assert df.iloc[5, 0] == '1234'  # PS-28 Numerical data in text columns gets read
+        # One bulk extraction instead of a pandas indexer per assertion
+        values = df.to_numpy()
+        nan_mask = df.isna().to_numpy()
+        assert values[4, 2] == 9
+        assert values[1, 2] == '{{(* age 30)}}'
+        assert nan_mask[2, 2]
+        assert nan_mask[3, 1]  # PS-15 Accept 'NaN' as NaN marker
+        assert values[5, 0] == '1234'  # PS-28 Numerical data in text columns gets read
         assert df.shape == (6, 3)
         t2 = b.tables[2]
         assert t2.name == 'taxidermy'
-        assert t2.df.iloc[3, 3] == pd.Timestamp('2012-05-01 12:34')
+        assert t2.df.iloc[3, 3] == _TS_2012_05_01_1234
         assert pd.isna(t2.df.iloc[1, 3])
         assert t.evaluate_expressions({'age': 3}).df.iloc[1, 2] == 90
 
@@ -400,20 +482,37 @@ class TestBundle:
         assert t.col_units == ['text', '-', 'kg']
         assert t.destinations == ['your_farm', 'my_farm', 'farms_galore']
         df = t.df
-        assert df.iloc[4, 2] == 9
-        assert df.iloc[1, 2] == '{{(* age 30)}}'
-        assert np.isnan(df.iloc[2, 2])
-        assert np.isnan(df.iloc[3, 1])  # PS-15 Accept 'NaN' as NaN marker
-        assert df.iloc[5, 0] == '1234'  # PS-28 Numerical data in text columns gets read
+        # One bulk extraction instead of a pandas indexer per assertion
+        values = df.to_numpy()
+        nan_mask = df.isna().to_numpy()
+        assert values[4, 2] == 9
+        assert values[1, 2] == '{{(* age 30)}}'
+        assert nan_mask[2, 2]
+        assert nan_mask[3, 1]  # PS-15 Accept 'NaN' as NaN marker
+        assert values[5, 0] == '1234'  # PS-28 Numerical data in text columns gets read
         assert df.shape == (6, 3)
         t2 = b.tables[2]  # Table on second sheet!
         assert t2.name == 'taxidermy'
-        assert t2.df.iloc[3, 3] == pd.Timestamp('2012-05-01 12:34:56')
+        assert t2.df.iloc[3, 3] == _TS_2012_05_01_123456
         assert pd.isna(t2.df.iloc[1, 3])
         assert t.evaluate_expressions({'age': 3}).df.iloc[1, 2] == 90
 
         assert len(b.tables[3]) == 0  # PS-5 Empty StarTables are ignored / omitted
 
+    def test_read_excel_calamine_matches_fallback(self, xlsx_path: Path, monkeypatch):
+        pytest.importorskip('python_calamine')
+        b = read_excel(xlsx_path)  # plain path + package installed: calamine path
+        # Disable the calamine fast path to get the openpyxl fallback
+        monkeypatch.setattr('startables.startables._read_excel_rows_calamine', lambda io: None)
+        b_ref = read_excel(xlsx_path)
+        assert len(b.tables) == len(b_ref.tables)
+        for t, t_ref in zip(b.tables, b_ref.tables):
+            assert t.name == t_ref.name
+            assert t.destinations == t_ref.destinations
+            assert t.col_names == t_ref.col_names
+            assert t.col_units == t_ref.col_units
+            pd.testing.assert_frame_equal(t.df, t_ref.df)
+
     def test_read_illegal(self, input_dir: Path):
         with open(str(input_dir / 'example_illegal_empty_cell.csv')) as f:
             with pytest.raises(ValueError):
@@ -486,100 +585,48 @@ class TestBundle:
     def test_to_csv(self, some_bundle: Bundle):
         out = io.StringIO()
         some_bundle.to_csv(out)
-        assert out.getvalue() == dedent("""\
-            **farm_animals;;;
-            your_farm my_farm farms_galore
-            species;n_legs;avg_weight
-            text;-;kg
-            chicken;2.0;3
-            pig;4.0;{{(* age 30)}}
-            goat;4.0;-
-            cow;-;200
-            goose;2.0;9
-            1234;-;-
-            
-            **fruit;;;
-            all
-            kind;is_yummy
-            text;onoff
-            apple;0
-            raspberry;1
-            strawberry;1
-            pineapple;0
-            
-            **taxidermy;;;
-            all
-            name;species;needs_repair;time_of_death
-            text;text;onoff;datetime
-            Sam;crow;1;2012-04-28 12:34:00
-            Guy;mouse;0;-
-            Kurt;ferret;0;2012-04-30 12:34:00
-            Louise;rabbit;0;2012-05-01 12:34:00
-            
-            **empty_table;;;
-            all
-            foo;bar
-            text;-
-            
-            """)
-
-    def test_to_excel(self, some_bundle: Bundle, tmpdir):
-        some_bundle.to_excel(tmpdir.join('some_bundle.xlsx'))
+        assert out.getvalue() == _EXPECTED_BUNDLE_CSV
+
+    def test_to_excel(self, some_bundle: Bundle, tmp_path: Path):
+        some_bundle.to_excel(tmp_path / 'some_bundle.xlsx')
+
+    def test_to_excel_xlsxwriter(self, some_bundle: Bundle, tmp_path: Path):
+        pytest.importorskip('xlsxwriter')
+        # Both engines must round-trip to the same bundle
+        xlsxwriter_path = tmp_path / 'some_bundle_xlsxwriter.xlsx'
+        openpyxl_path = tmp_path / 'some_bundle_openpyxl.xlsx'
+        some_bundle.to_excel(xlsxwriter_path, engine='xlsxwriter')
+        some_bundle.to_excel(openpyxl_path)  # default engine='openpyxl'
+        b = read_excel(xlsxwriter_path)
+        b_ref = read_excel(openpyxl_path)
+        assert len(b.tables) == len(b_ref.tables) == len(some_bundle.tables)
+        for t, t_ref in zip(b.tables, b_ref.tables):
+            assert t.name == t_ref.name
+            assert t.destinations == t_ref.destinations
+            assert t.col_names == t_ref.col_names
+            assert t.col_units == t_ref.col_units
+            pd.testing.assert_frame_equal(t.df, t_ref.df)
+
+    def test_to_excel_unsupported_engine(self, some_bundle: Bundle, tmp_path: Path):
+        with raises(ValueError, match="engine: 'bogus'"):
+            some_bundle.to_excel(tmp_path / 'never_written.xlsx', engine='bogus')
 
     def test_to_csv_with_header(self, some_bundle: Bundle):
         out = io.StringIO()
         some_bundle.to_csv(out, header='Info table\nWith:; farm animals, Fruit, etc.\t', sep=';')
-        print(out.getvalue())
-        assert out.getvalue() == dedent("""\
-            Info table
-            With:; farm animals, Fruit, etc.
-            ;;;
-            **farm_animals;;;
-            your_farm my_farm farms_galore
-            species;n_legs;avg_weight
-            text;-;kg
-            chicken;2.0;3
-            pig;4.0;{{(* age 30)}}
-            goat;4.0;-
-            cow;-;200
-            goose;2.0;9
-            1234;-;-
-
-            **fruit;;;
-            all
-            kind;is_yummy
-            text;onoff
-            apple;0
-            raspberry;1
-            strawberry;1
-            pineapple;0
-
-            **taxidermy;;;
-            all
-            name;species;needs_repair;time_of_death
-            text;text;onoff;datetime
-            Sam;crow;1;2012-04-28 12:34:00
-            Guy;mouse;0;-
-            Kurt;ferret;0;2012-04-30 12:34:00
-            Louise;rabbit;0;2012-05-01 12:34:00
-
-            **empty_table;;;
-            all
-            foo;bar
-            text;-
-
-            """)
-
-    def test_to_excel_with_header(self, some_bundle: Bundle, tmpdir):
+        assert out.getvalue() == ('Info table\nWith:; farm animals, Fruit, etc.\n;;;\n'
+                                  + _EXPECTED_BUNDLE_CSV)
+
+    def test_to_excel_with_header(self, some_bundle: Bundle, tmp_path: Path):
 
         header = ' Test Header\nDate:; Today\nNumeric Value:; 0.123\n'
         header_sep = ';'
 
         # write the bundle to excel
-        some_bundle.to_excel(tmpdir.join('some_bundle.xlsx'), header=header, header_sep=header_sep)
+        some_bundle.to_excel(tmp_path / 'some_bundle.xlsx', header=header, header_sep=header_sep)
 
         # now read in the excel table
-        wb = load_workbook(filename=tmpdir.join('some_bundle.xlsx'), read_only=True)
+        wb = load_workbook(filename=tmp_path / 'some_bundle.xlsx', read_only=True)
         ws = wb.active
         # compare line/rows and their contents
         for line, row in zip(header.split('\n'), ws.rows):
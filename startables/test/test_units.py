@@ -1,4 +1,6 @@
+import functools
 import math
+import operator
 
 from pytest import fixture, raises, approx
 
@@ -76,6 +78,17 @@ class TestCustomUnitConversion:
         assert custom_unit_conversion != \
                CustomUnitConversion(Unit('zonk'), Unit('bork'), lambda x: x ** 2, lambda x: x)
 
+    def test_eq_funcs_without_code(self):
+        # Builtins and functools.partial objects have no __code__;
+        # they must still be accepted, and then compare by identity
+        assert CustomUnitConversion(Unit('zonk'), Unit('bork'), abs, abs) == \
+               CustomUnitConversion(Unit('zonk'), Unit('bork'), abs, abs)
+        assert CustomUnitConversion(Unit('zonk'), Unit('bork'), abs, abs) != \
+               CustomUnitConversion(Unit('zonk'), Unit('bork'), abs, lambda x: x)
+        halve = functools.partial(operator.mul, 0.5)
+        double = functools.partial(operator.mul, 2)
+        assert CustomUnitConversion(Unit('zonk'), Unit('bork'), double, halve).to_ref(21) == 42
+
     def test_to_ref(self, custom_unit_conversion):
         assert custom_unit_conversion.to_ref(12) == 144
 
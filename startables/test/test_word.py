@@ -22,3 +22,17 @@ def test_import_from_word(input_dir):
     assert 'Key' in table.col_names
     assert 'Value' in table.col_names
     assert str(table.df.iloc[0]['Value']) in 'Aaron the Aardvark'  # 'Item_A'
+
+
+def test_import_from_word_merged_cells(input_dir):
+    # A horizontally merged cell (w:gridSpan) covers several grid columns;
+    # its text must be repeated so data rows keep one entry per column
+    input_docx = os.path.join(str(input_dir), 'docx', 'merged_cells.docx')
+    bundle = import_from_word(input_docx)
+    assert len(bundle.tables) == 1
+
+    table = bundle.tables[0]
+    assert table.name == 'MergedFoo'
+    assert table.col_names == ['Key', 'Value', 'Comment']
+    assert table.df.shape == (2, 3)
+    assert table.df.iloc[1]['Value'] == table.df.iloc[1]['Comment'] == 'merged across two columns'
@@ -1,3 +1,4 @@
+import collections
 import copy
 import itertools
 from abc import ABC, abstractmethod
@@ -101,6 +102,10 @@ class IdentityUnitConversion(UnitConversion):
     def reverse(self):
         return IdentityUnitConversion(src_unit=self._ref_unit, ref_unit=self._src_unit)
 
+    def alias(self, src_unit_alias: Unit) -> 'IdentityUnitConversion':
+        # Direct construction; skips copy.copy's reflective dispatch
+        return IdentityUnitConversion(src_unit_alias, self._ref_unit)
+
     def __eq__(self, other):
         return (self.ref_unit, self.src_unit) == (other.ref_unit, other.src_unit)
 
@@ -131,6 +136,9 @@ class ScaleUnitConversion(UnitConversion):
         return ScaleUnitConversion(src_unit=self._ref_unit, ref_unit=self._src_unit,
                                    ref_per_src=1 / self.ref_per_src)
 
+    def alias(self, src_unit_alias: Unit) -> 'ScaleUnitConversion':
+        return ScaleUnitConversion(src_unit_alias, self._ref_unit, self.ref_per_src)
+
     def __eq__(self, other):
         return (self.ref_unit, self.src_unit, self.ref_per_src) == \
                (other.ref_unit, other.src_unit, other.ref_per_src)
@@ -169,6 +177,9 @@ class AffineUnitConversion(UnitConversion):
         return AffineUnitConversion(src_unit=self._ref_unit, ref_unit=self._src_unit,
                                     slope=1 / self.slope, intercept=-self.intercept / self.slope)
 
+    def alias(self, src_unit_alias: Unit) -> 'AffineUnitConversion':
+        return AffineUnitConversion(src_unit_alias, self._ref_unit, self.slope, self.intercept)
+
     def __eq__(self, other):
         return (self.ref_unit, self.src_unit, self.slope, self.intercept) == \
                (other.ref_unit, other.src_unit, other.slope, other.intercept)
@@ -178,6 +189,16 @@ class AffineUnitConversion(UnitConversion):
                f"value_ref = value_src * {self.slope} + {self.intercept}"
 
 
+def _func_eq_key(f: Callable):
+    """
+    Comparison key for a conversion function: its bytecode where available,
+    else the callable itself. Builtins, functools.partial objects and other
+    C-level callables have no __code__ and then compare by identity.
+    """
+    code = getattr(f, '__code__', None)
+    return code.co_code if code is not None else f
+
+
 class CustomUnitConversion(UnitConversion):
     """
     For unit pairs that are not convertible via the other UnitConversion implementations.
@@ -198,6 +219,9 @@ class CustomUnitConversion(UnitConversion):
         super().__init__(src_unit, ref_unit)
         self.to_ref_func = to_ref_func
         self.from_ref_func = from_ref_func
+        # Cached once: the function objects never change, and fetching
+        # __code__.co_code per __eq__ call is the expensive part
+        self._code_key = (_func_eq_key(to_ref_func), _func_eq_key(from_ref_func))
 
     def to_ref(self, value_src):
         return self.to_ref_func(value_src)
@@ -209,15 +233,19 @@ class CustomUnitConversion(UnitConversion):
         return CustomUnitConversion(src_unit=self._ref_unit, ref_unit=self._src_unit,
                                     to_ref_func=self.from_ref_func, from_ref_func=self.to_ref_func)
 
+    def alias(self, src_unit_alias: Unit) -> 'CustomUnitConversion':
+        return CustomUnitConversion(src_unit_alias, self._ref_unit,
+                                    self.to_ref_func, self.from_ref_func)
+
     def __eq__(self, other):
         # That hack tho... figuring out whether two functions are "equal" by comparing their bytecode.
         # There will arguably be false negatives in the case of two slightly
         # different implementations of the same thing, e.g. lambda x:x+5*2+3 and lambda x:x+3+5*2
         # but just don't, ok?
-        return (self.ref_unit, self.src_unit,
-                self.to_ref_func.__code__.co_code, self.from_ref_func.__code__.co_code) == \
-               (other.ref_unit, other.src_unit,
-                other.to_ref_func.__code__.co_code, other.from_ref_func.__code__.co_code)
+        # src/ref units are read live (alias() rebinds the source unit after
+        # construction); only the immutable bytecode pair is precomputed
+        return (self.ref_unit, self.src_unit, self._code_key) == \
+               (other.ref_unit, other.src_unit, other._code_key)
 
     def __repr__(self):
         return f"{self.__class__}, source unit '{self.src_unit}', ref unit '{self.ref_unit}', " \
@@ -283,16 +311,22 @@ class CustomUnitPolicy(UnitPolicy):
         if duplicates not in valid_duplicates_values:
             raise ValueError(f"duplicates: Expected one of {valid_duplicates_values}, got '{duplicates}'.")
 
-        src_units = [uc.src_unit for uc in unit_conversions]
+        # Materialize up front: __init__ iterates the conversions several
+        # times, which would silently come up empty for a one-shot iterator
+        unit_conversions = list(unit_conversions)
+
+        # One counting pass both detects duplicates and yields the source-unit
+        # set needed below
+        counts = collections.Counter(uc.src_unit for uc in unit_conversions)
 
         if duplicates == 'raise':
-            duplicate_units = set(u for u in src_units if src_units.count(u) > 1)
+            duplicate_units = {u for u, n in counts.items() if n > 1}
             if duplicate_units:
                 raise ValueError(f"Conflicting conversions supplied for units: {duplicate_units}.")
 
         ref_units = {uc.ref_unit for uc in unit_conversions}
 
-        dual_role_units = set(src_units).intersection(ref_units)
+        dual_role_units = set(counts).intersection(ref_units)
         if dual_role_units:
             raise ValueError(f"Supplied units have conflicting roles (both source and reference): {dual_role_units}")
             # TODO this can be relaxed a bit. A given unit can be both source and ref, if and only if it strictly points to itself in a single UnitConversion (typically an IdentityUnitConversion).
@@ -302,6 +336,15 @@ class CustomUnitPolicy(UnitPolicy):
         self._unit_conversions = {uc.src_unit: uc for uc in itertools.chain(
             unit_conversions, (IdentityUnitConversion(ru, ru) for ru in ref_units))}
 
+        # Fused (from_unit, to_unit) -> callable cache, filled on first use by
+        # convert(). Collapses the two dict lookups, ref-unit compare and two
+        # method dispatches per call into one dict fetch and one call.
+        self._pair_cache = {}
+
+        # Flat src_unit -> ref_unit map; the policy is immutable after init,
+        # so ref_unit() and can_convert() reduce to plain dict fetches
+        self._ref_units = {u: uc.ref_unit for u, uc in self._unit_conversions.items()}
+
     def __iter__(self):
         """
         Returns the units that are present in this unit policy.
@@ -309,23 +352,44 @@ class CustomUnitPolicy(UnitPolicy):
         yield from self._unit_conversions
 
     def convert(self, value, from_unit: Unit, to_unit: Unit):
-        ucs = self._unit_conversions
-        # TODO Some room to optimize trivial and semi-trivial cases, e.g. when
-        # * to_unit is same as from_unit
-        # * to_unit (or from_unit) is same as ref unit.
-        # Worth it?
+        try:
+            return self._pair_cache[(from_unit, to_unit)](value)
+        except KeyError:
+            pass
+        fused = self._fuse_conversion(from_unit, to_unit)
+        self._pair_cache[(from_unit, to_unit)] = fused
+        return fused(value)
 
+    def _fuse_conversion(self, from_unit: Unit, to_unit: Unit) -> Callable[[T], T]:
+        """
+        Build the fused from_unit -> to_unit conversion callable cached by
+        convert(). Identity steps are skipped entirely and the rest collapses
+        to bound-method calls, so the validation, ref-unit compare and dict
+        lookups are paid once per pair instead of once per call. Arithmetic
+        stays in the original to_ref-then-from_ref order, bit-exact with the
+        uncached path.
+        """
+        ucs = self._unit_conversions
         try:
-            if ucs[from_unit].ref_unit == ucs[to_unit].ref_unit:
-                # Both share same ref unit. First convert from from_unit to ref unit, then from ref unit to to_unit.
-                return ucs[to_unit].from_ref(ucs[from_unit].to_ref(value))
-            raise ValueError(f"Can't convert: '{from_unit}' and '{to_unit}' do not share same reference unit.")
+            uc_from, uc_to = ucs[from_unit], ucs[to_unit]
         except KeyError as ke:
             if from_unit in ucs:
                 raise ValueError(f"Unit '{to_unit}' not found in unit policy.") from ke
             if to_unit in ucs:
                 raise ValueError(f"Unit '{from_unit}' not found in unit policy.") from ke
             raise ValueError(f"Units '{from_unit}' and '{to_unit}' not found in unit policy.") from ke
+        if uc_from.ref_unit != uc_to.ref_unit:
+            raise ValueError(f"Can't convert: '{from_unit}' and '{to_unit}' do not share same reference unit.")
+
+        from_is_noop = isinstance(uc_from, IdentityUnitConversion)
+        to_is_noop = isinstance(uc_to, IdentityUnitConversion)
+        if from_is_noop and to_is_noop:
+            return lambda value: value
+        if from_is_noop:
+            return uc_to.from_ref
+        if to_is_noop:
+            return uc_from.to_ref
+        return lambda value: uc_to.from_ref(uc_from.to_ref(value))
 
         # if from_unit in ucs:
         #     if to_unit in ucs:
@@ -347,16 +411,14 @@ class CustomUnitPolicy(UnitPolicy):
 
     def ref_unit(self, src_unit: Unit) -> Unit:
         try:
-            return self._unit_conversions[src_unit].ref_unit
+            return self._ref_units[src_unit]
         except KeyError as ke:
             raise ValueError(f"Unit '{src_unit}' not found in unit policy.") from ke
-        # if src_unit in self._unit_conversions:
-        #     return self._unit_conversions[src_unit].ref_unit
-        # raise ValueError(f"Unit '{src_unit}' not found in unit policy.")
 
     def can_convert(self, from_unit: Unit, to_unit: Unit) -> bool:
         """
         Check whether a conversion from from_unit to to_unit is supported by this unit policy.
         """
-        ucs = self._unit_conversions
-        return from_unit in ucs and to_unit in ucs and ucs[from_unit].ref_unit == ucs[to_unit].ref_unit
+        refs = self._ref_units
+        from_ref = refs.get(from_unit)
+        return from_ref is not None and from_ref == refs.get(to_unit)